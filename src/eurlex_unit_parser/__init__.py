@@ -1,7 +1,12 @@
 """Public package API for eurlex-unit-parser."""
 
 from eurlex_unit_parser.api import JobResult, ParseResult, download_and_parse, parse_file, parse_html
-from eurlex_unit_parser.download.eurlex import DownloadResult, download_eurlex, extract_name_from_url
+from eurlex_unit_parser.download.eurlex import (
+    DownloadResult,
+    EurLexDownloader,
+    download_eurlex,
+    extract_name_from_url,
+)
 from eurlex_unit_parser.models import (
     Citation,
     DocumentMetadata,
@@ -25,6 +30,7 @@ __all__ = [
     "download_eurlex",
     "extract_name_from_url",
     "DownloadResult",
+    "EurLexDownloader",
     "parse_html",
     "parse_file",
     "download_and_parse",
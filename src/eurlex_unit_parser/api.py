@@ -13,6 +13,7 @@ from eurlex_unit_parser.summary import (
     extract_celex_from_text,
     fetch_lsu_summary,
 )
+from eurlex_unit_parser.text_utils import read_html_file
 
 
 @dataclass
@@ -58,7 +59,7 @@ def parse_html(
         summary_lsu, summary_lsu_status = None, LSU_STATUS_DISABLED
 
     return ParseResult(
-        units=list(units),
+        units=units,
         document_metadata=parser.document_metadata,
         summary_lsu=summary_lsu,
         summary_lsu_status=summary_lsu_status,
@@ -76,7 +77,7 @@ def parse_file(
 ) -> ParseResult:
     """Parse an HTML file from disk."""
     path = Path(input_path)
-    html_content = path.read_text(encoding="utf-8")
+    html_content = read_html_file(path)
     return parse_html(
         html_content,
         source_file=str(path),
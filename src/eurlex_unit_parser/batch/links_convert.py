@@ -7,6 +7,8 @@ import csv
 import json
 from pathlib import Path
 
+JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 
 def csv_row_to_jsonl_entry(row: dict[str, str]) -> dict[str, str]:
     return {
@@ -19,17 +21,13 @@ def csv_row_to_jsonl_entry(row: dict[str, str]) -> dict[str, str]:
 
 
 def convert_csv_to_jsonl(csv_path: Path, jsonl_path: Path) -> int:
-    count = 0
     jsonl_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(csv_path, newline="", encoding="utf-8") as csv_file, open(
-        jsonl_path, "w", encoding="utf-8"
-    ) as jsonl_file:
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
         reader = csv.DictReader(csv_file)
-        for row in reader:
-            entry = csv_row_to_jsonl_entry(row)
-            jsonl_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
-            count += 1
-    return count
+        lines = [JSONL_ENCODER.encode(csv_row_to_jsonl_entry(row)) + "\n" for row in reader]
+    with open(jsonl_path, "w", encoding="utf-8") as jsonl_file:
+        jsonl_file.writelines(lines)
+    return len(lines)
 
 
 def main() -> None:
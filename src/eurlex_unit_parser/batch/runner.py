@@ -6,13 +6,18 @@ import argparse
 import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
 import time
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 BASE = Path(__file__).resolve().parents[3]
+BASE_PREFIX = f"{BASE}{os.sep}"
 LINKS_FILE = BASE / "data" / "eurlex_links.jsonl"
 DOWNLOAD_DIR = BASE / "downloads" / "eur-lex"
 JSON_DIR = BASE / "out" / "json"
@@ -25,6 +30,9 @@ PARSER_MODULE = "eurlex_unit_parser.cli.parse"
 COVERAGE_MODULE = "eurlex_unit_parser.cli.coverage"
 DOWNLOADER_MODULE = "eurlex_unit_parser.cli.download"
 
+FILENAME_TRANSLATION = str.maketrans({":": "_", "/": "_"})
+UNSAFE_TAG_CHARS_RE = re.compile(r"[^\w-]")
+
 DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
 JSON_DIR.mkdir(parents=True, exist_ok=True)
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -38,13 +46,23 @@ def ensure_output_dirs() -> None:
     BATCH_REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _subprocess_env() -> dict[str, str]:
-    """Ensure subprocess module invocations can import local src package."""
+@lru_cache(maxsize=1)
+def _subprocess_env() -> Mapping[str, str]:
+    """Ensure subprocess module invocations can import local src package.
+
+    The environment is built once and shared read-only by every subprocess call;
+    use ``refresh_subprocess_env`` after changing ``os.environ`` mid-run.
+    """
     env = os.environ.copy()
     src_path = str(BASE / "src")
     current = env.get("PYTHONPATH")
     env["PYTHONPATH"] = src_path if not current else f"{src_path}{os.pathsep}{current}"
-    return env
+    return MappingProxyType(env)
+
+
+def refresh_subprocess_env() -> None:
+    """Drop the cached subprocess environment so the next call re-reads ``os.environ``."""
+    _subprocess_env.cache_clear()
 
 
 def stable_hash(url: str) -> str:
@@ -54,14 +72,18 @@ def stable_hash(url: str) -> str:
 def filename_from_entry(entry: dict) -> str:
     celex = entry.get("celex")
     if celex:
-        return celex.replace(":", "_").replace("/", "_")
+        return celex.translate(FILENAME_TRANSLATION)
     return stable_hash(entry["url"])
 
 
 def to_repo_relative(path: Path) -> str:
     """Return path relative to repository root for portable reports."""
+    # BASE is already resolved, so paths built from it need no filesystem lookups.
+    absolute = os.path.abspath(path)
+    if absolute.startswith(BASE_PREFIX):
+        return absolute[len(BASE_PREFIX) :]
     try:
-        return str(path.resolve().relative_to(BASE.resolve()))
+        return str(path.resolve().relative_to(BASE))
     except ValueError:
         return str(path)
 
@@ -77,18 +99,20 @@ def load_entries(links_file: Path) -> list[dict]:
 
 
 def slice_entries(entries: list[dict], offset: int = 0, limit: int | None = None) -> list[dict]:
+    """Return the batch window; the input list itself is returned when the window covers it."""
     if offset < 0:
         raise ValueError("offset must be >= 0")
     if limit is not None and limit <= 0:
         raise ValueError("limit must be > 0 when provided")
 
-    if limit is None:
-        return entries[offset:]
-    return entries[offset : offset + limit]
+    end = None if limit is None else offset + limit
+    if offset == 0 and (end is None or end >= len(entries)):
+        return entries
+    return entries[offset:end]
 
 
 def write_batch_snapshots(snapshot_tag: str) -> tuple[Path, Path]:
-    safe_tag = "".join(ch if ch.isalnum() or ch in ("-", "_") else "_" for ch in snapshot_tag.strip())
+    safe_tag = UNSAFE_TAG_CHARS_RE.sub("_", snapshot_tag.strip())
     success_snapshot = BATCH_REPORTS_DIR / f"{safe_tag}_success.jsonl"
     failure_snapshot = BATCH_REPORTS_DIR / f"{safe_tag}_failures.jsonl"
     shutil.copy2(SUCCESS_FILE, success_snapshot)
@@ -112,8 +136,8 @@ def download_html(url: str, html_path: Path) -> tuple[bool, str]:
                 "--output-dir",
                 str(html_path.parent),
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=120,
             env=_subprocess_env(),
         )
@@ -161,14 +185,15 @@ def parse_html(html_path: Path, json_path: Path, force: bool = False) -> tuple[b
                 str(json_path),
                 "--no-validation",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             timeout=120,
             env=_subprocess_env(),
         )
         if result.returncode == 0 and json_path.exists():
             return True, "ok"
-        return False, f"parser_exit_{result.returncode}: {result.stderr[:200]}"
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        return False, f"parser_exit_{result.returncode}: {stderr[:200]}"
     except subprocess.TimeoutExpired:
         return False, "parser_timeout"
     except Exception as e:
@@ -225,8 +250,6 @@ def run_coverage(html_path: Path, json_path: Path, oracle: str = "naive") -> dic
                 except json.JSONDecodeError:
                     pass
         else:
-            import re
-
             cov_match = re.search(r"(\d+(?:\.\d+)?)%\s+(?:text recall|coverage)", output)
             if cov_match:
                 report["coverage_pct"] = float(cov_match.group(1))
@@ -290,8 +313,11 @@ def run_batch(
     except ValueError as e:
         print(f"ERROR: {e}")
         return 1
+    # Release entries outside the window before the long-running loop starts.
+    del all_entries
+    total = len(entries)
 
-    print(f"Loaded {len(entries)} links from {links_file} (offset={offset}, limit={limit})")
+    print(f"Loaded {total} links from {links_file} (offset={offset}, limit={limit})")
 
     SUCCESS_FILE.write_text("")
     FAILURE_FILE.write_text("")
@@ -305,7 +331,7 @@ def run_batch(
         html_path = DOWNLOAD_DIR / f"{fname}.html"
         json_path = JSON_DIR / f"{fname}.json"
 
-        print(f"\n[{i}/{len(entries)}] {fname}")
+        print(f"\n[{i}/{total}] {fname}")
         print(f"  URL: {url}")
 
         dl_ok, dl_method = download_html(url, html_path)
@@ -392,7 +418,7 @@ def run_batch(
     print("\n" + "=" * 60)
     print("BATCH SUMMARY")
     print("=" * 60)
-    print(f"Total: {len(entries)}")
+    print(f"Total: {total}")
     print(f"PASS:  {success_count}")
     print(f"FAIL:  {failure_count}")
     print(f"Success report: {SUCCESS_FILE}")
@@ -3,21 +3,26 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
+import io
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import TypedDict
 
-from bs4 import BeautifulSoup
-
 from eurlex_unit_parser.coverage import (
     build_full_html_text_by_section,
     build_json_section_texts,
     coverage_test,
+    detect_format_html,
+    parse_coverage_html,
     print_report,
     validate_hierarchy,
     validate_ordering,
 )
+from eurlex_unit_parser.text_utils import read_html_bytes
 
 
 class PhantomReport(TypedDict):
@@ -25,6 +30,110 @@ class PhantomReport(TypedDict):
     by_section: dict[str, list[str]]
 
 
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer command-line value."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+
+def _check_file(html_path: Path, args: argparse.Namespace, write_report: bool) -> bool | None:
+    """Run the coverage checks for one HTML file; return None when its inputs are missing."""
+    if not html_path.exists():
+        print(f"Error: HTML file not found: {html_path}", file=sys.stderr)
+        return None
+
+    json_path = Path(args.json) if args.json else Path("out/json") / f"{html_path.stem}.json"
+    if not json_path.exists():
+        print(f"Error: JSON file not found: {json_path}", file=sys.stderr)
+        return None
+
+    print(f"\n{'#' * 60}")
+    print(f"# {html_path.name}")
+    print(f"{'#' * 60}")
+
+    # The naive oracle reads its own lxml tree; bs4 is only needed for mirror and phantom checks.
+    soup = None
+    is_consolidated = None
+    if args.oracle == "mirror" or not args.no_phantom:
+        html = read_html_bytes(html_path)
+        soup = parse_coverage_html(html)
+        # The strained soup only keeps section subtrees, so the format comes from the whole source.
+        is_consolidated = detect_format_html(html)
+    with open(json_path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if not isinstance(payload, dict):
+        print(
+            f"Error: Unsupported JSON format in {json_path}: expected object root with key 'units'.",
+            file=sys.stderr,
+        )
+        return False
+    units = payload.get("units")
+    if not isinstance(units, list):
+        print(
+            f"Error: Unsupported JSON format in {json_path}: key 'units' must be a list.",
+            file=sys.stderr,
+        )
+        return False
+
+    try:
+        report = coverage_test(
+            html_path,
+            json_path,
+            oracle=args.oracle,
+            soup=soup,
+            units=units,
+            is_consolidated=is_consolidated,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return False
+
+    phantom_report: PhantomReport | None = None
+    if soup is not None and not args.no_phantom:
+        full_html = build_full_html_text_by_section(soup)
+        json_sections = build_json_section_texts(units)
+        phantom_report = {"total": 0, "by_section": {}}
+        for key, texts in json_sections.items():
+            html_text = full_html.get(key, "")
+            missing: list[str] = []
+            for t in texts:
+                if t and t not in html_text:
+                    missing.append(t[:100] + ("..." if len(t) > 100 else ""))
+            phantom_report["by_section"][key] = missing
+            phantom_report["total"] += len(missing)
+
+    hierarchy = validate_hierarchy(units)
+    ordering = validate_ordering(units)
+
+    passed = print_report(report, hierarchy, args.verbose, phantom_report, ordering)
+
+    if write_report:
+        full_report = {
+            "coverage": report,
+            "hierarchy": hierarchy,
+            "phantom": phantom_report,
+            "ordering": ordering,
+        }
+        report_json = json.dumps(full_report, ensure_ascii=False, indent=2)
+        Path(args.report).write_bytes(report_json.encode("utf-8"))
+        print(f"\nReport saved to: {args.report}")
+
+    return passed
+
+
+def _check_file_captured(html_path: Path, args: argparse.Namespace) -> tuple[bool | None, str, str]:
+    """Run ``_check_file`` in a worker process, returning its console output for ordered replay."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        passed = _check_file(html_path, args, write_report=False)
+    return passed, stdout.getvalue(), stderr.getvalue()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Test parser coverage")
     parser.add_argument("--input", "-i", help="Path to HTML file")
@@ -34,6 +143,12 @@ def main() -> None:
     parser.add_argument("--report", "-r", help="Save report to JSON file")
     parser.add_argument("--oracle", choices=["naive", "mirror"], default="naive", help="Coverage oracle to use")
     parser.add_argument("--no-phantom", action="store_true", help="Disable phantom text check")
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Number of worker processes used to check multiple files (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -48,77 +163,19 @@ def main() -> None:
 
     all_passed = True
 
-    for html_path in html_files:
-        if not html_path.exists():
-            print(f"Error: HTML file not found: {html_path}", file=sys.stderr)
-            continue
-
-        json_path = Path(args.json) if args.json else Path("out/json") / f"{html_path.stem}.json"
-        if not json_path.exists():
-            print(f"Error: JSON file not found: {json_path}", file=sys.stderr)
-            continue
-
-        print(f"\n{'#' * 60}")
-        print(f"# {html_path.name}")
-        print(f"{'#' * 60}")
-
-        with open(html_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f.read(), "lxml")
-        with open(json_path, "r", encoding="utf-8") as f:
-            payload = json.load(f)
-        if not isinstance(payload, dict):
-            print(
-                f"Error: Unsupported JSON format in {json_path}: expected object root with key 'units'.",
-                file=sys.stderr,
-            )
-            all_passed = False
-            continue
-        units = payload.get("units")
-        if not isinstance(units, list):
-            print(
-                f"Error: Unsupported JSON format in {json_path}: key 'units' must be a list.",
-                file=sys.stderr,
-            )
-            all_passed = False
-            continue
-
-        try:
-            report = coverage_test(html_path, json_path, oracle=args.oracle)
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            all_passed = False
-            continue
-
-        phantom_report: PhantomReport | None = None
-        if not args.no_phantom:
-            full_html = build_full_html_text_by_section(soup)
-            json_sections = build_json_section_texts(units)
-            phantom_report = {"total": 0, "by_section": {}}
-            for key, texts in json_sections.items():
-                html_text = full_html.get(key, "")
-                missing: list[str] = []
-                for t in texts:
-                    if t and t not in html_text:
-                        missing.append(t[:100] + ("..." if len(t) > 100 else ""))
-                phantom_report["by_section"][key] = missing
-                phantom_report["total"] += len(missing)
-
-        hierarchy = validate_hierarchy(units)
-        ordering = validate_ordering(units)
-
-        passed = print_report(report, hierarchy, args.verbose, phantom_report, ordering)
-        all_passed = all_passed and passed
-
-        if args.report and len(html_files) == 1:
-            full_report = {
-                "coverage": report,
-                "hierarchy": hierarchy,
-                "phantom": phantom_report,
-                "ordering": ordering,
-            }
-            with open(args.report, "w", encoding="utf-8") as f:
-                json.dump(full_report, f, ensure_ascii=False, indent=2)
-            print(f"\nReport saved to: {args.report}")
+    if args.jobs > 1 and len(html_files) > 1:
+        # Files are checked independently; output is replayed in input order once each finishes.
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for passed, out, err in executor.map(_check_file_captured, html_files, repeat(args)):
+                sys.stdout.write(out)
+                sys.stderr.write(err)
+                if passed is False:
+                    all_passed = False
+    else:
+        write_report = bool(args.report) and len(html_files) == 1
+        for html_path in html_files:
+            if _check_file(html_path, args, write_report) is False:
+                all_passed = False
 
     raise SystemExit(0 if all_passed else 1)
 
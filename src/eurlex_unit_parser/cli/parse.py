@@ -5,14 +5,25 @@ from __future__ import annotations
 import argparse
 import json
 import sys
-from dataclasses import asdict
+from dataclasses import asdict, fields
 from pathlib import Path
+from typing import Any
 
 from eurlex_unit_parser import EUParser
 from eurlex_unit_parser.summary import (
     LSU_STATUS_DISABLED,
     fetch_lsu_summary,
 )
+from eurlex_unit_parser.text_utils import read_html_file
+
+
+def _dataclass_as_json(obj: Any) -> dict[str, Any]:
+    """``json.dumps`` default hook serialising dataclasses without the deep copy made by ``asdict``."""
+    try:
+        obj_fields = fields(obj)
+    except TypeError:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable") from None
+    return {f.name: getattr(obj, f.name) for f in obj_fields}
 
 
 def main() -> None:
@@ -68,8 +79,7 @@ def main() -> None:
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         raise SystemExit(1)
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        html_content = f.read()
+    html_content = read_html_file(input_path)
 
     eu_parser = EUParser(source_file=str(input_path))
     units = eu_parser.parse(html_content)
@@ -83,24 +93,25 @@ def main() -> None:
             language=args.summary_lsu_lang,
         )
 
-    units_data = [asdict(u) for u in units]
     output_data = {
-        "document_metadata": asdict(eu_parser.document_metadata) if eu_parser.document_metadata else None,
-        "summary_lsu": asdict(summary_lsu) if summary_lsu else None,
+        "document_metadata": eu_parser.document_metadata,
+        "summary_lsu": summary_lsu,
         "summary_lsu_status": summary_lsu_status,
-        "units": units_data,
+        "units": units,
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    output_json = json.dumps(output_data, ensure_ascii=False, indent=2, default=_dataclass_as_json)
+    output_path.write_bytes(output_json.encode("utf-8"))
 
     print(f"Parsed {len(units)} units -> {output_path}")
 
     if validation_path:
         validation_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(validation_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(eu_parser.validation), f, ensure_ascii=False, indent=2)
+        validation_json = json.dumps(
+            eu_parser.validation, ensure_ascii=False, indent=2, default=_dataclass_as_json
+        )
+        validation_path.write_bytes(validation_json.encode("utf-8"))
 
         status = "PASS" if eu_parser.validation.is_valid() else "ISSUES FOUND"
         print(f"Validation: {status} -> {validation_path}")
@@ -116,8 +127,15 @@ def main() -> None:
         try:
             from eurlex_unit_parser.coverage import coverage_test, print_report, validate_hierarchy
 
-            report = coverage_test(input_path, output_path)
-            hierarchy = validate_hierarchy(units_data)
+            units_data = [asdict(u) for u in units]
+            report = coverage_test(
+                input_path,
+                output_path,
+                soup=eu_parser.soup,
+                units=units_data,
+                is_consolidated=eu_parser.is_consolidated,
+            )
+            hierarchy = validate_hierarchy(units)
             passed = print_report(report, hierarchy, verbose=False)
             if not passed:
                 raise SystemExit(1)
@@ -4,15 +4,21 @@ from eurlex_unit_parser.coverage.core import compare_counters, coverage_test
 from eurlex_unit_parser.coverage.extract_html import (
     build_full_html_text_by_section,
     build_naive_section_map,
+    build_naive_section_map_lxml,
     detect_format,
+    detect_format_html,
+    detect_format_lxml,
     extract_paragraph_texts_consolidated,
     extract_paragraph_texts_oj,
     extract_point_texts_consolidated,
     extract_point_texts_oj,
     normalize_whitespace,
+    parse_coverage_html,
+    parse_coverage_lxml,
 )
 from eurlex_unit_parser.coverage.extract_json import (
     build_json_section_texts,
+    extract_json_all_counters,
     extract_json_all_texts,
     extract_json_paragraph_texts,
     extract_json_point_texts,
@@ -24,9 +30,13 @@ __all__ = [
     "build_full_html_text_by_section",
     "build_json_section_texts",
     "build_naive_section_map",
+    "build_naive_section_map_lxml",
     "compare_counters",
     "coverage_test",
     "detect_format",
+    "detect_format_html",
+    "detect_format_lxml",
+    "extract_json_all_counters",
     "extract_json_all_texts",
     "extract_json_paragraph_texts",
     "extract_json_point_texts",
@@ -35,6 +45,8 @@ __all__ = [
     "extract_point_texts_consolidated",
     "extract_point_texts_oj",
     "normalize_whitespace",
+    "parse_coverage_html",
+    "parse_coverage_lxml",
     "print_report",
     "validate_hierarchy",
     "validate_ordering",
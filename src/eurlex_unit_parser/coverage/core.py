@@ -10,18 +10,24 @@ from bs4 import BeautifulSoup
 
 from eurlex_unit_parser.coverage.extract_html import (
     build_naive_section_map,
+    build_naive_section_map_lxml,
     detect_format,
+    detect_format_html,
+    detect_format_lxml,
     extract_paragraph_texts_consolidated,
     extract_paragraph_texts_oj,
     extract_point_texts_consolidated,
     extract_point_texts_oj,
+    parse_coverage_html,
+    parse_coverage_lxml,
 )
 from eurlex_unit_parser.coverage.extract_json import (
     build_json_section_texts,
-    extract_json_all_texts,
-    extract_json_paragraph_texts,
-    extract_json_point_texts,
+    extract_json_all_counters,
 )
+from eurlex_unit_parser.text_utils import read_html_bytes
+
+NAIVE_TEXT_SEPARATOR = "\x00"
 
 
 def _load_units_payload(payload: object, json_path: Path) -> list[dict]:
@@ -39,57 +45,113 @@ def _load_units_payload(payload: object, json_path: Path) -> list[dict]:
     return units
 
 
-def compare_counters(html_counter: Counter, json_counter: Counter) -> dict:
-    """
-    Compare two counters.
+def _paragraph_section_order(key: str) -> tuple[bool, int, str]:
+    return key != "recitals", int(key) if key.isdigit() else 999, key
 
-    Returns {missing, missing_raw, extra, matched}.
-    """
+
+def _point_section_order(key: str) -> tuple[int, str]:
+    return int(key) if key.isdigit() else 999, key
+
+
+def _truncate_segment(text: str) -> str:
+    if len(text) <= 100:
+        return text
+    return text[:100] + "..."
+
+
+def _compare_counters(html_counter: Counter, json_counter: Counter) -> tuple[dict, Counter]:
+    missing_counter = html_counter - json_counter
+    extra_counter = json_counter - html_counter
+
+    missing_raw = list(missing_counter.elements())
     missing = []
-    missing_raw = []
+    for text, count in missing_counter.items():
+        missing.extend([_truncate_segment(text)] * count)
     extra = []
-    matched = 0
-
-    for text, count in html_counter.items():
-        json_count = json_counter.get(text, 0)
-        if json_count < count:
-            for _ in range(count - json_count):
-                missing.append(text[:100] + ("..." if len(text) > 100 else ""))
-                missing_raw.append(text)
-        matched += min(count, json_count)
+    for text, count in extra_counter.items():
+        extra.extend([_truncate_segment(text)] * count)
 
-    for text, count in json_counter.items():
-        html_count = html_counter.get(text, 0)
-        if count > html_count:
-            for _ in range(count - html_count):
-                extra.append(text[:100] + ("..." if len(text) > 100 else ""))
+    comparison = {"missing": missing, "missing_raw": missing_raw, "extra": extra}
+    return comparison, missing_counter
 
-    return {"missing": missing, "missing_raw": missing_raw, "extra": extra, "matched": matched}
 
+def compare_counters(html_counter: Counter, json_counter: Counter) -> dict:
+    """
+    Compare two counters.
 
-def coverage_test(html_path: Path, json_path: Path, oracle: str = "naive") -> dict:
-    """Run coverage test comparing HTML and JSON."""
-    with open(html_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f.read(), "lxml")
+    Returns {missing, missing_raw, extra, matched}.
+    """
+    comparison = _compare_counters(html_counter, json_counter)[0]
+    comparison["matched"] = sum((html_counter & json_counter).values())
+    return comparison
+
+
+def _mirror_section_report(html_c: Counter, json_c: Counter, all_c: Counter) -> dict:
+    """Compare one section and split its missing segments into gone and misclassified."""
+    comparison, missing_counter = _compare_counters(html_c, json_c)
+    html_count = sum(html_c.values())
+    missing = comparison["missing"]
+    # Every missing copy of a text still present elsewhere in the section is misclassified.
+    misclassified = sum(count for text, count in missing_counter.items() if text in all_c)
+    return {
+        "html_count": html_count,
+        "json_count": sum(json_c.values()),
+        # Extracted counters only hold positive counts, so each HTML copy is either matched or missing.
+        "matched": html_count - len(missing),
+        "missing": missing,
+        "missing_raw": comparison["missing_raw"],
+        "extra": comparison["extra"],
+        "gone": len(missing) - misclassified,
+        "misclassified": misclassified,
+    }
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        payload = json.load(f)
 
-    units = _load_units_payload(payload, json_path)
+def coverage_test(
+    html_path: Path,
+    json_path: Path,
+    oracle: str = "naive",
+    *,
+    soup: BeautifulSoup | None = None,
+    units: list[dict] | None = None,
+    use_lxml: bool = True,
+    is_consolidated: bool | None = None,
+) -> dict:
+    """
+    Run coverage test comparing HTML and JSON.
+    Callers that already hold the parsed HTML or the serialized units can pass ``soup`` and
+    ``units``; the matching file is then neither read nor parsed again.
+    A supplied ``soup`` is taken to hold the whole document unless ``is_consolidated`` is given;
+    callers passing a ``parse_coverage_html`` soup should pass ``detect_format_html`` of its source.
+    Without a ``soup``, the naive oracle reads a plain lxml tree unless ``use_lxml`` is False.
+    """
+    naive_sections: dict[str, list[str]] | None = None
+    if soup is None:
+        html = read_html_bytes(html_path)
+        if oracle != "mirror" and use_lxml:
+            root = parse_coverage_lxml(html)
+            consolidated = detect_format_lxml(root) if is_consolidated is None else is_consolidated
+            naive_sections = build_naive_section_map_lxml(root)
+        else:
+            soup = parse_coverage_html(html)
+            # The coverage soup only keeps section subtrees; detect the format on the whole source.
+            consolidated = detect_format_html(html) if is_consolidated is None else is_consolidated
+    else:
+        consolidated = detect_format(soup) if is_consolidated is None else is_consolidated
 
-    is_consolidated = detect_format(soup)
+    if units is None:
+        with open(json_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        units = _load_units_payload(payload, json_path)
 
     if oracle == "mirror":
-        if is_consolidated:
+        if consolidated:
             html_paragraphs = extract_paragraph_texts_consolidated(soup)
             html_points = extract_point_texts_consolidated(soup)
         else:
             html_paragraphs = extract_paragraph_texts_oj(soup)
             html_points = extract_point_texts_oj(soup)
 
-        json_paragraphs = extract_json_paragraph_texts(units)
-        json_points = extract_json_point_texts(units)
-        json_all = extract_json_all_texts(units)
+        json_paragraphs, json_points, json_all = extract_json_all_counters(units)
     else:
         html_paragraphs = {}
         html_points = {}
@@ -97,7 +159,7 @@ def coverage_test(html_path: Path, json_path: Path, oracle: str = "naive") -> di
         json_points = {}
 
     report = {
-        "format": "Consolidated" if is_consolidated else "OJ (Official Journal)",
+        "format": "Consolidated" if consolidated else "OJ (Official Journal)",
         "paragraphs": {},
         "points": {},
         "summary": {},
@@ -105,76 +167,39 @@ def coverage_test(html_path: Path, json_path: Path, oracle: str = "naive") -> di
     }
 
     if oracle == "mirror":
-        all_keys = set(html_paragraphs.keys()) | set(json_paragraphs.keys())
+        empty: Counter = Counter()
         total_html_par = 0
         total_missing_par = 0
-
-        for key in sorted(all_keys, key=lambda x: (x != "recitals", int(x) if x.isdigit() else 999)):
-            html_c = html_paragraphs.get(key, Counter())
-            json_c = json_paragraphs.get(key, Counter())
-            comparison = compare_counters(html_c, json_c)
-
-            report["paragraphs"][key] = {
-                "html_count": sum(html_c.values()),
-                "json_count": sum(json_c.values()),
-                "matched": comparison["matched"],
-                "missing": comparison["missing"],
-                "missing_raw": comparison["missing_raw"],
-                "extra": comparison["extra"],
-            }
-            total_html_par += sum(html_c.values())
-            total_missing_par += len(comparison["missing"])
-
-        all_keys = set(html_points.keys()) | set(json_points.keys())
         total_html_pt = 0
         total_missing_pt = 0
-
-        for key in sorted(all_keys, key=lambda x: int(x) if x.isdigit() else 999):
-            html_c = html_points.get(key, Counter())
-            json_c = json_points.get(key, Counter())
-            comparison = compare_counters(html_c, json_c)
-
-            report["points"][key] = {
-                "html_count": sum(html_c.values()),
-                "json_count": sum(json_c.values()),
-                "matched": comparison["matched"],
-                "missing": comparison["missing"],
-                "missing_raw": comparison["missing_raw"],
-                "extra": comparison["extra"],
-            }
-            total_html_pt += sum(html_c.values())
-            total_missing_pt += len(comparison["missing"])
-
         total_gone = 0
         total_misclassified = 0
 
-        for key, data in report["paragraphs"].items():
-            gone_count = 0
-            misclassified_count = 0
-            all_c = json_all.get(key, Counter())
-            for raw_text in data.get("missing_raw", []):
-                if all_c.get(raw_text, 0) > 0:
-                    misclassified_count += 1
-                else:
-                    gone_count += 1
-            data["gone"] = gone_count
-            data["misclassified"] = misclassified_count
-            total_gone += gone_count
-            total_misclassified += misclassified_count
-
-        for key, data in report["points"].items():
-            gone_count = 0
-            misclassified_count = 0
-            all_c = json_all.get(key, Counter())
-            for raw_text in data.get("missing_raw", []):
-                if all_c.get(raw_text, 0) > 0:
-                    misclassified_count += 1
-                else:
-                    gone_count += 1
-            data["gone"] = gone_count
-            data["misclassified"] = misclassified_count
-            total_gone += gone_count
-            total_misclassified += misclassified_count
+        all_keys = set(html_paragraphs.keys()) | set(json_paragraphs.keys())
+        for key in sorted(all_keys, key=_paragraph_section_order):
+            data = _mirror_section_report(
+                html_paragraphs.get(key, empty),
+                json_paragraphs.get(key, empty),
+                json_all.get(key, empty),
+            )
+            report["paragraphs"][key] = data
+            total_html_par += data["html_count"]
+            total_missing_par += len(data["missing"])
+            total_gone += data["gone"]
+            total_misclassified += data["misclassified"]
+
+        all_keys = set(html_points.keys()) | set(json_points.keys())
+        for key in sorted(all_keys, key=_point_section_order):
+            data = _mirror_section_report(
+                html_points.get(key, empty),
+                json_points.get(key, empty),
+                json_all.get(key, empty),
+            )
+            report["points"][key] = data
+            total_html_pt += data["html_count"]
+            total_missing_pt += len(data["missing"])
+            total_gone += data["gone"]
+            total_misclassified += data["misclassified"]
 
         total_html = total_html_par + total_html_pt
         total_missing = total_missing_par + total_missing_pt
@@ -187,7 +212,7 @@ def coverage_test(html_path: Path, json_path: Path, oracle: str = "naive") -> di
             "text_recall_pct": 100.0 * (total_html - total_gone) / total_html if total_html > 0 else 100.0,
         }
     else:
-        naive_html = build_naive_section_map(soup)
+        naive_html = naive_sections if naive_sections is not None else build_naive_section_map(soup)
         json_sections = build_json_section_texts(units)
 
         total_html = 0
@@ -195,10 +220,17 @@ def coverage_test(html_path: Path, json_path: Path, oracle: str = "naive") -> di
         for key in sorted(naive_html.keys()):
             html_segments = naive_html.get(key, [])
             json_texts = json_sections.get(key, [])
+            # One substring search per segment; a match can only span two JSON texts
+            # if the segment itself contains the separator, which falls back to per-text checks.
+            haystack = NAIVE_TEXT_SEPARATOR.join(json_texts)
             missing = []
             for seg in html_segments:
-                if not any(seg in jt for jt in json_texts):
-                    missing.append(seg[:100] + ("..." if len(seg) > 100 else ""))
+                if NAIVE_TEXT_SEPARATOR in seg:
+                    found = any(seg in jt for jt in json_texts)
+                else:
+                    found = seg in haystack
+                if not found:
+                    missing.append(_truncate_segment(seg))
 
             report["paragraphs"][key] = {
                 "html_count": len(html_segments),
@@ -2,24 +2,40 @@
 
 from __future__ import annotations
 
+import copy
 import re
 from collections import Counter
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
 
-from eurlex_unit_parser.text_utils import get_cell_text, is_list_table, normalize_text, remove_note_tags, strip_leading_label
+from eurlex_unit_parser.text_utils import (
+    TEXT_STRING_TYPES,
+    get_cell_text,
+    get_text_without_notes,
+    is_list_table,
+    normalize_text,
+    strip_leading_label,
+)
 
 LABEL_ONLY_RE = re.compile(
     r"^(Article\s+\d+[A-Z]?|ANNEX\s+[IVXLC0-9]+|Part\s+[A-Z]|CHAPTER\s+[IVXLC0-9]+|SECTION\s+[IVXLC0-9]+|SUB-?SECTION\s+[IVXLC0-9]+|TITLE\s+[IVXLC0-9]+)(\s+[-—–:]\s+.*|\s+.*)?$",
     re.IGNORECASE,
 )
 PUNCT_LABEL_RE = re.compile(r"^\(?[a-zivx0-9]{1,4}\)?[.)]?$", re.IGNORECASE)
-WHITESPACE_RE = re.compile(r"\s+")
 LEADING_REF_RE = re.compile(r"^(?:['“”‘’]?\(?[a-zivx0-9]{1,4}\)?[.)]?)\s+", re.IGNORECASE)
 LEADING_NUM_RE = re.compile(r"^(\d+)[.)]\s+")
 LEADING_DASH_RE = re.compile(r"^[—–-]\s+")
 
-NAIVE_HEADING_CLASSES = {
+# Compiled id filters let bs4 match ids with a C regex search instead of a Python callback per tag.
+RCT_ID_RE = re.compile(r"^rct_")
+ART_ID_RE = re.compile(r"^art_")
+RCT_OR_ART_ID_RE = re.compile(r"^(?:rct_|art_)")
+ANX_ID_RE = re.compile(r"^\s*anx_")
+COVERAGE_SECTION_ID_RE = re.compile(r"^(?:rct_|art_|\s*anx_)")
+PARAGRAPH_ID_RE = re.compile(r"^\d{3}\.\d{3}$")
+
+NAIVE_HEADING_CLASSES = frozenset({
     "oj-ti-art",
     "oj-sti-art",
     "oj-doc-ti",
@@ -35,11 +51,46 @@ NAIVE_HEADING_CLASSES = {
     "oj-ti-grseq-10",
     "title-article-norm",
     "stitle-article-norm",
-}
+})
+CORRELATION_HEADING_CLASSES = NAIVE_HEADING_CLASSES | {"oj-ti-tbl"}
+# Classes whose presence anywhere in a document marks the consolidated layout.
+CONSOLIDATED_MARKERS = ("title-article-norm", "grid-container")
+CONSOLIDATED_MARKER_BYTES = tuple(marker.encode("ascii") for marker in CONSOLIDATED_MARKERS)
+# bs4 stores text under these tags as special string types that get_text() leaves out.
+# The lxml helpers (NON_TEXT_TAGS, _string_kind, _collect_lxml_strings) hand-copy the
+# string-container and get_text() rules of beautifulsoup4 4.12 to 4.15, which is why the
+# dependency is capped below 4.16. Re-check them before lifting the cap: the extract_html
+# helper tests compare NON_TEXT_TAGS with bs4's string containers and both oracle paths.
+NON_TEXT_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+# Recital, article and annex containers are the only subtrees coverage helpers read.
+COVERAGE_SECTION_STRAINER = SoupStrainer("div", id=COVERAGE_SECTION_ID_RE)
+
+
+def parse_coverage_html(html: str | bytes) -> BeautifulSoup:
+    """
+    Parse HTML for coverage checks, building only recital, article and annex subtrees.
+    Raw bytes are handed to lxml as UTF-8 directly, skipping Python-side decoding.
+    """
+    if isinstance(html, bytes):
+        return BeautifulSoup(html, "lxml", parse_only=COVERAGE_SECTION_STRAINER, from_encoding="utf-8")
+    return BeautifulSoup(html, "lxml", parse_only=COVERAGE_SECTION_STRAINER)
+
+
+def parse_coverage_lxml(html: str | bytes) -> etree._Element:
+    """Parse HTML into a plain lxml tree for the naive oracle's lxml code path."""
+    root = etree.fromstring(html, etree.HTMLParser(encoding="utf-8"))
+    if root is None:
+        return etree.Element("html")
+    return root
 
 
 def detect_format(soup: BeautifulSoup) -> bool:
-    """Detect if this is consolidated format."""
+    """
+    Detect if this is consolidated format.
+    Expects a soup of the whole document, as the parser builds it; a ``parse_coverage_html``
+    soup only holds section subtrees, so use ``detect_format_html`` on its source instead.
+    """
     if soup.find("p", class_="title-article-norm"):
         return True
     if soup.find("div", class_="grid-container"):
@@ -48,7 +99,7 @@ def detect_format(soup: BeautifulSoup) -> bool:
 
 
 def normalize_whitespace(text: str) -> str:
-    return WHITESPACE_RE.sub(" ", text).strip()
+    return " ".join(text.split())
 
 
 def looks_like_label(line: str) -> bool:
@@ -73,13 +124,26 @@ def strip_leading_ref(line: str) -> str:
     return line.strip()
 
 
+def _collect_naive_strings(node: Tag, parts: list[str]) -> None:
+    """Collect stripped text strings under ``node``, skipping heading-class subtrees."""
+    for child in node.children:
+        if isinstance(child, Tag):
+            if NAIVE_HEADING_CLASSES.isdisjoint(child.get("class") or ()):
+                _collect_naive_strings(child, parts)
+        elif type(child) in TEXT_STRING_TYPES:
+            text = child.strip()
+            if text:
+                parts.append(text)
+
+
 def extract_naive_segments(container: Tag, min_len: int = 10) -> list[str]:
-    clone = BeautifulSoup(str(container), "lxml")
-    for cls in NAIVE_HEADING_CLASSES:
-        for tag in clone.find_all(class_=cls):
-            tag.decompose()
+    parts: list[str] = []
+    _collect_naive_strings(container, parts)
+    return _naive_segments_from_strings(parts, min_len)
+
 
-    raw = clone.get_text(separator="\n", strip=True)
+def _naive_segments_from_strings(parts: list[str], min_len: int) -> list[str]:
+    raw = "\n".join(parts)
     lines = [normalize_whitespace(line_text) for line_text in raw.splitlines()]
     segments = []
     for line in lines:
@@ -93,14 +157,17 @@ def extract_naive_segments(container: Tag, min_len: int = 10) -> list[str]:
 
 
 def is_correlation_table_annex(div: Tag) -> bool:
-    heading_texts = []
-    for cls in list(NAIVE_HEADING_CLASSES) + ["oj-ti-tbl", "oj-doc-ti"]:
-        for tag in div.find_all(class_=cls):
-            heading_texts.append(tag.get_text(separator=" ", strip=True))
-    for p in div.find_all("p", limit=5):
-        heading_texts.append(p.get_text(separator=" ", strip=True))
-    for text in heading_texts:
-        if "correlation table" in text.lower():
+    # One walk checks headings and the first five paragraphs, stopping at the first hit.
+    paragraphs_left = 5
+    for tag in div.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        is_leading_paragraph = tag.name == "p" and paragraphs_left > 0
+        if is_leading_paragraph:
+            paragraphs_left -= 1
+        if (
+            is_leading_paragraph or not CORRELATION_HEADING_CLASSES.isdisjoint(tag.get("class") or ())
+        ) and "correlation table" in tag.get_text(separator=" ", strip=True).lower():
             return True
     return False
 
@@ -111,7 +178,7 @@ def build_naive_section_map(soup: BeautifulSoup) -> dict[str, list[str]]:
     for div in soup.find_all(
         "div",
         class_="eli-subdivision",
-        id=lambda x: x and (x.startswith("rct_") or x.startswith("art_")),
+        id=RCT_OR_ART_ID_RE,
     ):
         source_id = div.get("id", "")
         if source_id.startswith("rct_"):
@@ -122,7 +189,7 @@ def build_naive_section_map(soup: BeautifulSoup) -> dict[str, list[str]]:
         sections.setdefault(key, []).extend(extract_naive_segments(div))
 
     for div in soup.find_all(
-        "div", class_="eli-container", id=lambda x: x and x.strip().startswith("anx_")
+        "div", class_="eli-container", id=ANX_ID_RE
     ):
         if is_correlation_table_annex(div):
             continue
@@ -134,9 +201,149 @@ def build_naive_section_map(soup: BeautifulSoup) -> dict[str, list[str]]:
     return sections
 
 
+def _element_classes(element: etree._Element) -> list[str]:
+    return (element.get("class") or "").split()
+
+
+def _is_section_div(element: etree._Element) -> bool:
+    return element.tag == "div" and bool(COVERAGE_SECTION_ID_RE.search(element.get("id") or ""))
+
+
+def _string_kind(element: etree._Element) -> str | None:
+    """
+    Return the non-text tag whose bs4 string type holds ``element``'s own text, or None for plain text.
+    Only tags inside the outermost coverage section count; the strained soup never builds the rest.
+    """
+    kind = None
+    in_section = False
+    for node in reversed([element, *element.iterancestors()]):
+        if in_section:
+            if node.tag in NON_TEXT_TAGS:
+                kind = node.tag
+        elif _is_section_div(node):
+            in_section = True
+    return kind
+
+
+def _collect_lxml_strings(
+    element: etree._Element,
+    parts: list[str],
+    kind: str | None = None,
+    wanted: str | None = None,
+    skip_classes: frozenset[str] | None = None,
+) -> None:
+    """Collect stripped ``wanted``-kind strings under ``element`` in document order, as bs4 would."""
+    if kind == wanted:
+        text = (element.text or "").strip()
+        if text:
+            parts.append(text)
+    for child in element:
+        # Comments and processing instructions have a callable tag; only their tail is text.
+        if isinstance(child.tag, str) and (
+            skip_classes is None or skip_classes.isdisjoint(_element_classes(child))
+        ):
+            child_kind = child.tag if child.tag in NON_TEXT_TAGS else kind
+            # Below a non-text tag every string has a non-text kind, so plain text can stop there.
+            if wanted is not None or child_kind is None:
+                _collect_lxml_strings(child, parts, child_kind, wanted, skip_classes)
+        if kind == wanted:
+            tail = (child.tail or "").strip()
+            if tail:
+                parts.append(tail)
+
+
+def _lxml_text(element: etree._Element) -> str:
+    """``Tag.get_text(separator=" ", strip=True)`` for ``element`` in the strained soup."""
+    kind = _string_kind(element)
+    # bs4 tags read only the string type their own tag name holds.
+    wanted = element.tag if element.tag in NON_TEXT_TAGS else None
+    if kind != wanted:
+        return ""
+    parts: list[str] = []
+    _collect_lxml_strings(element, parts, kind, wanted)
+    return " ".join(parts)
+
+
+def _extract_naive_segments_lxml(container: etree._Element, min_len: int = 10) -> list[str]:
+    if _string_kind(container) is not None:
+        return []
+    parts: list[str] = []
+    _collect_lxml_strings(container, parts, skip_classes=NAIVE_HEADING_CLASSES)
+    return _naive_segments_from_strings(parts, min_len)
+
+
+def detect_format_lxml(root: etree._Element) -> bool:
+    """Detect consolidated format on a whole-document lxml tree, like ``detect_format``."""
+    for element in root.iter("p", "div"):
+        marker = "title-article-norm" if element.tag == "p" else "grid-container"
+        if marker in _element_classes(element):
+            return True
+    return False
+
+
+def detect_format_html(html: str | bytes) -> bool:
+    """
+    Detect consolidated format from unparsed HTML, agreeing with ``detect_format`` on its soup.
+    Sources without either marker class are settled by a substring search, without parsing.
+    """
+    markers = CONSOLIDATED_MARKERS if isinstance(html, str) else CONSOLIDATED_MARKER_BYTES
+    if not any(marker in html for marker in markers):
+        return False
+    return detect_format_lxml(parse_coverage_lxml(html))
+
+
+def _is_correlation_table_annex_lxml(div: etree._Element) -> bool:
+    paragraphs_left = 5
+    for element in div.iterdescendants():
+        if not isinstance(element.tag, str):
+            continue
+        is_leading_paragraph = element.tag == "p" and paragraphs_left > 0
+        if is_leading_paragraph:
+            paragraphs_left -= 1
+        if (
+            is_leading_paragraph
+            or not CORRELATION_HEADING_CLASSES.isdisjoint(_element_classes(element))
+        ) and "correlation table" in _lxml_text(element).lower():
+            return True
+    return False
+
+
+def build_naive_section_map_lxml(root: etree._Element) -> dict[str, list[str]]:
+    """``build_naive_section_map`` over a plain lxml tree from ``parse_coverage_lxml``."""
+    sections: dict[str, list[str]] = {}
+    annex_divs = []
+
+    for div in root.iter("div"):
+        source_id = div.get("id")
+        if source_id is None:
+            continue
+        classes = _element_classes(div)
+        if "eli-subdivision" in classes and RCT_OR_ART_ID_RE.search(source_id):
+            if source_id.startswith("rct_"):
+                key = "recitals"
+            else:
+                article_num = source_id.replace("art_", "")
+                key = f"art_{article_num}"
+        elif "eli-container" in classes and ANX_ID_RE.search(source_id):
+            annex_divs.append(div)
+            continue
+        else:
+            continue
+        sections.setdefault(key, []).extend(_extract_naive_segments_lxml(div))
+
+    for div in annex_divs:
+        if _is_correlation_table_annex_lxml(div):
+            continue
+        source_id = div.get("id", "").strip()
+        annex_num = source_id.replace("anx_", "").strip()
+        key = f"annex_{annex_num}" if annex_num else "annex"
+        sections.setdefault(key, []).extend(_extract_naive_segments_lxml(div))
+
+    return sections
+
+
 def get_consolidated_text_for_test(element: Tag) -> str:
-    clone = BeautifulSoup(str(element), "lxml")
-    root = clone.find("div") or clone.find("p") or clone
+    root = copy.copy(element)
 
     for grid in root.find_all("div", class_="grid-container"):
         grid.decompose()
@@ -156,25 +363,21 @@ def get_consolidated_text_for_test(element: Tag) -> str:
 def extract_paragraph_texts_oj(soup: BeautifulSoup) -> dict[str, Counter]:
     result = {"recitals": Counter()}
 
-    for div in soup.find_all("div", class_="eli-subdivision", id=lambda x: x and x.startswith("rct_")):
+    for div in soup.find_all("div", class_="eli-subdivision", id=RCT_ID_RE):
         table = div.find("table")
         if table and is_list_table(table):
             rows = table.find_all("tr")
             for row in rows:
                 cells = row.find_all("td")
                 if len(cells) >= 2:
-                    content_copy = BeautifulSoup(str(cells[1]), "lxml").find("td") or cells[1]
-                    remove_note_tags(content_copy)
-                    text = content_copy.get_text(separator=" ", strip=True)
+                    text = get_text_without_notes(cells[1])
                     text = normalize_text(text)
                     if text and len(text) > 5:
                         result["recitals"][text] += 1
         else:
             combined_parts = []
             for p in div.find_all("p", class_="oj-normal"):
-                p_copy = BeautifulSoup(str(p), "lxml").find("p")
-                remove_note_tags(p_copy)
-                text = p_copy.get_text(separator=" ", strip=True)
+                text = get_text_without_notes(p)
                 text, _ = strip_leading_label(text)
                 if text:
                     combined_parts.append(text)
@@ -183,11 +386,11 @@ def extract_paragraph_texts_oj(soup: BeautifulSoup) -> dict[str, Counter]:
             if full_text and len(full_text) > 5:
                 result["recitals"][full_text] += 1
 
-    for div in soup.find_all("div", class_="eli-subdivision", id=lambda x: x and x.startswith("art_")):
+    for div in soup.find_all("div", class_="eli-subdivision", id=ART_ID_RE):
         article_num = div.get("id", "").replace("art_", "")
         result[article_num] = Counter()
 
-        paragraph_divs = div.find_all("div", id=re.compile(r"^\d{3}\.\d{3}$"), recursive=False)
+        paragraph_divs = div.find_all("div", id=PARAGRAPH_ID_RE, recursive=False)
 
         if paragraph_divs:
             for par_div in paragraph_divs:
@@ -195,18 +398,14 @@ def extract_paragraph_texts_oj(soup: BeautifulSoup) -> dict[str, Counter]:
                     if not isinstance(child, Tag):
                         continue
                     if child.name == "p" and "oj-normal" in child.get("class", []):
-                        p_copy = BeautifulSoup(str(child), "lxml").find("p") or child
-                        remove_note_tags(p_copy)
-                        text = p_copy.get_text(separator=" ", strip=True)
+                        text = get_text_without_notes(child)
                         text, _ = strip_leading_label(text)
                         text = normalize_text(text)
                         if text and len(text) > 5:
                             result[article_num][text] += 1
         else:
             for p in div.find_all("p", class_="oj-normal", recursive=False):
-                p_copy = BeautifulSoup(str(p), "lxml").find("p") or p
-                remove_note_tags(p_copy)
-                text = p_copy.get_text(separator=" ", strip=True)
+                text = get_text_without_notes(p)
                 text, _ = strip_leading_label(text)
                 text = normalize_text(text)
                 if text and len(text) > 5:
@@ -218,7 +417,7 @@ def extract_paragraph_texts_oj(soup: BeautifulSoup) -> dict[str, Counter]:
 def extract_point_texts_oj(soup: BeautifulSoup) -> dict[str, Counter]:
     result = {}
 
-    for div in soup.find_all("div", class_="eli-subdivision", id=lambda x: x and x.startswith("art_")):
+    for div in soup.find_all("div", class_="eli-subdivision", id=ART_ID_RE):
         article_num = div.get("id", "").replace("art_", "")
         result[article_num] = Counter()
 
@@ -245,7 +444,7 @@ def extract_point_texts_oj(soup: BeautifulSoup) -> dict[str, Counter]:
 def extract_paragraph_texts_consolidated(soup: BeautifulSoup) -> dict[str, Counter]:
     result = {}
 
-    for div in soup.find_all("div", class_="eli-subdivision", id=lambda x: x and x.startswith("art_")):
+    for div in soup.find_all("div", class_="eli-subdivision", id=ART_ID_RE):
         article_num = div.get("id", "").replace("art_", "")
         result[article_num] = Counter()
 
@@ -285,7 +484,7 @@ def extract_paragraph_texts_consolidated(soup: BeautifulSoup) -> dict[str, Count
 def extract_point_texts_consolidated(soup: BeautifulSoup) -> dict[str, Counter]:
     result = {}
 
-    for div in soup.find_all("div", class_="eli-subdivision", id=lambda x: x and x.startswith("art_")):
+    for div in soup.find_all("div", class_="eli-subdivision", id=ART_ID_RE):
         article_num = div.get("id", "").replace("art_", "")
         result[article_num] = Counter()
 
@@ -307,7 +506,7 @@ def build_full_html_text_by_section(soup: BeautifulSoup) -> dict[str, str]:
     for div in soup.find_all(
         "div",
         class_="eli-subdivision",
-        id=lambda x: x and (x.startswith("rct_") or x.startswith("art_")),
+        id=RCT_OR_ART_ID_RE,
     ):
         source_id = div.get("id", "")
         if source_id.startswith("rct_"):
@@ -315,23 +514,17 @@ def build_full_html_text_by_section(soup: BeautifulSoup) -> dict[str, str]:
         else:
             article_num = source_id.replace("art_", "")
             key = f"art_{article_num}"
-        clone = BeautifulSoup(str(div), "lxml")
-        root = clone.find("div") or clone
-        remove_note_tags(root)
-        text = normalize_text(root.get_text(separator=" ", strip=True))
+        text = normalize_text(get_text_without_notes(div))
         if key in sections:
             sections[key] = f"{sections[key]} {text}".strip()
         else:
             sections[key] = text
 
-    for div in soup.find_all("div", class_="eli-container", id=lambda x: x and x.strip().startswith("anx_")):
+    for div in soup.find_all("div", class_="eli-container", id=ANX_ID_RE):
         source_id = div.get("id", "").strip()
         annex_num = source_id.replace("anx_", "").strip()
         key = f"annex_{annex_num}" if annex_num else "annex"
-        clone = BeautifulSoup(str(div), "lxml")
-        root = clone.find("div") or clone
-        remove_note_tags(root)
-        text = normalize_text(root.get_text(separator=" ", strip=True))
+        text = normalize_text(get_text_without_notes(div))
         if key in sections:
             sections[key] = f"{sections[key]} {text}".strip()
         else:
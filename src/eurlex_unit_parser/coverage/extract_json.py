@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, defaultdict
 
 from eurlex_unit_parser.coverage.extract_html import normalize_whitespace
 
+PARAGRAPH_TYPES = frozenset({"paragraph", "subparagraph", "intro"})
+POINT_TYPES = frozenset({"point", "subpoint", "subsubpoint"})
 
-def extract_json_paragraph_texts(units: list[dict]) -> dict[str, Counter]:
-    result = {"recitals": Counter()}
+
+def extract_json_all_counters(
+    units: list[dict],
+) -> tuple[dict[str, Counter], dict[str, Counter], dict[str, Counter]]:
+    """Return (paragraph, point, all) text counters per section from a single pass over units."""
+    paragraphs: dict[str, Counter] = {"recitals": Counter()}
+    points: dict[str, Counter] = {}
+    all_texts: dict[str, Counter] = {"recitals": Counter()}
 
     for unit in units:
         text = unit.get("text", "").strip()
@@ -18,70 +26,47 @@ def extract_json_paragraph_texts(units: list[dict]) -> dict[str, Counter]:
         unit_type = unit.get("type", "")
 
         if unit_type == "recital":
-            result["recitals"][text] += 1
-
-        elif unit_type in ("paragraph", "subparagraph", "intro"):
-            article_num = unit.get("article_number")
-            if article_num:
-                if article_num not in result:
-                    result[article_num] = Counter()
-                result[article_num][text] += 1
-
-    return result
-
-
-def extract_json_point_texts(units: list[dict]) -> dict[str, Counter]:
-    result = {}
+            paragraphs["recitals"][text] += 1
+            all_texts["recitals"][text] += 1
+            continue
 
-    for unit in units:
-        text = unit.get("text", "").strip()
-        if not text or len(text) <= 5:
+        if unit_type in PARAGRAPH_TYPES:
+            target: dict[str, Counter] | None = paragraphs
+        elif unit_type in POINT_TYPES or unit_type.startswith("nested_"):
+            target = points
+        elif unit_type == "unknown_unit":
+            target = None
+        else:
             continue
 
-        unit_type = unit.get("type", "")
+        article_num = unit.get("article_number")
+        if not article_num:
+            continue
+        if target is not None:
+            if article_num not in target:
+                target[article_num] = Counter()
+            target[article_num][text] += 1
+        if article_num not in all_texts:
+            all_texts[article_num] = Counter()
+        all_texts[article_num][text] += 1
 
-        if unit_type in ("point", "subpoint", "subsubpoint") or unit_type.startswith("nested_"):
-            article_num = unit.get("article_number")
-            if article_num:
-                if article_num not in result:
-                    result[article_num] = Counter()
-                result[article_num][text] += 1
+    return paragraphs, points, all_texts
 
-    return result
 
+def extract_json_paragraph_texts(units: list[dict]) -> dict[str, Counter]:
+    return extract_json_all_counters(units)[0]
 
-def extract_json_all_texts(units: list[dict]) -> dict[str, Counter]:
-    result = {"recitals": Counter()}
 
-    for unit in units:
-        text = unit.get("text", "").strip()
-        if not text or len(text) <= 5:
-            continue
+def extract_json_point_texts(units: list[dict]) -> dict[str, Counter]:
+    return extract_json_all_counters(units)[1]
 
-        unit_type = unit.get("type", "")
 
-        if unit_type == "recital":
-            result["recitals"][text] += 1
-        elif unit_type in (
-            "paragraph",
-            "subparagraph",
-            "intro",
-            "point",
-            "subpoint",
-            "subsubpoint",
-            "unknown_unit",
-        ) or unit_type.startswith("nested_"):
-            article_num = unit.get("article_number")
-            if article_num:
-                if article_num not in result:
-                    result[article_num] = Counter()
-                result[article_num][text] += 1
-
-    return result
+def extract_json_all_texts(units: list[dict]) -> dict[str, Counter]:
+    return extract_json_all_counters(units)[2]
 
 
 def build_json_section_texts(units: list[dict]) -> dict[str, list[str]]:
-    sections: dict[str, list[str]] = {}
+    sections: defaultdict[str, list[str]] = defaultdict(list)
 
     for unit in units:
         text = normalize_whitespace(unit.get("text", "") or "")
@@ -100,6 +85,6 @@ def build_json_section_texts(units: list[dict]) -> dict[str, list[str]]:
         else:
             continue
 
-        sections.setdefault(key, []).append(text)
+        sections[key].append(text)
 
-    return sections
+    return dict(sections)
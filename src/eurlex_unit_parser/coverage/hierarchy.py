@@ -2,108 +2,100 @@
 
 from __future__ import annotations
 
-
-def validate_hierarchy(units: list[dict]) -> dict:
-    """Validate hierarchy structure of parsed units."""
-    issues = []
-
-    all_ids = {u["id"] for u in units}
-    units_by_id = {u["id"]: u for u in units}
-
-    parent_type_rules = {
-        "subparagraph": ["paragraph"],
-        "point": ["paragraph", "subparagraph", "article"],
-        "subpoint": ["point", "annex_item"],
-        "subsubpoint": ["subpoint"],
-    }
-
-    for unit in units:
-        unit_id = unit["id"]
-        unit_type = unit["type"]
-        parent_id = unit.get("parent_id")
-
-        if parent_id and parent_id not in all_ids:
-            issues.append(
-                {
-                    "type": "orphan",
-                    "id": unit_id,
-                    "message": f"parent_id '{parent_id}' does not exist",
-                }
-            )
-
-        if parent_id and unit_type in parent_type_rules:
-            parent = units_by_id.get(parent_id)
-            if parent:
-                expected_types = parent_type_rules[unit_type]
-                if parent["type"] not in expected_types:
-                    issues.append(
-                        {
-                            "type": "wrong_parent_type",
-                            "id": unit_id,
-                            "message": f"{unit_type} has parent type '{parent['type']}', expected one of {expected_types}",
-                        }
-                    )
-
-        if unit_type == "paragraph" and unit.get("paragraph_number"):
-            expected_suffix = f".par-{unit['paragraph_number']}"
-            if expected_suffix not in unit_id:
-                issues.append(
-                    {
-                        "type": "id_mismatch",
-                        "id": unit_id,
-                        "message": f"paragraph_number={unit['paragraph_number']} doesn't match id",
-                    }
+from typing import cast
+
+from eurlex_unit_parser.models import Unit
+
+# (id, type, parent_id, paragraph_number, point_label)
+_HierarchyRow = tuple[str, str, str | None, str | None, str | None]
+
+PARENT_TYPE_RULES = {
+    "subparagraph": ["paragraph"],
+    "point": ["paragraph", "subparagraph", "article"],
+    "subpoint": ["point", "annex_item"],
+    "subsubpoint": ["subpoint"],
+}
+# Membership sets for the checks; the lists above keep their order for issue messages.
+ALLOWED_PARENT_TYPES = {
+    unit_type: frozenset(types) for unit_type, types in PARENT_TYPE_RULES.items()
+}
+
+# Only the first issues are kept; the rest are counted in the result's ``truncated`` field.
+MAX_HIERARCHY_ISSUES = 200
+
+
+def _id_ends_with(unit_id: str, suffix: str) -> bool:
+    """Return True if ``unit_id`` ends with ``suffix``, allowing the parser's ``_<n>`` duplicate marker."""
+    if unit_id.endswith(suffix):
+        return True
+    base_id, sep, duplicate = unit_id.rpartition("_")
+    return bool(sep) and duplicate.isdigit() and base_id.endswith(suffix)
+
+
+def _hierarchy_rows(units: list[Unit] | list[dict]) -> list[_HierarchyRow]:
+    """Read the fields checked by ``validate_hierarchy`` from ``Unit`` objects or unit dicts."""
+    if units and isinstance(units[0], Unit):
+        return [
+            (u.id, u.type, u.parent_id, u.paragraph_number, u.point_label)
+            for u in cast("list[Unit]", units)
+        ]
+    return [
+        (u["id"], u["type"], u.get("parent_id"), u.get("paragraph_number"), u.get("point_label"))
+        for u in cast("list[dict]", units)
+    ]
+
+
+def validate_hierarchy(units: list[Unit] | list[dict]) -> dict:
+    """Validate hierarchy structure of parsed units (``Unit`` objects or their dict form)."""
+    issues: list[dict] = []
+    truncated = 0
+
+    def add_issue(issue_type: str, unit_id: str, message: str) -> None:
+        nonlocal truncated
+        if len(issues) < MAX_HIERARCHY_ISSUES:
+            issues.append({"type": issue_type, "id": unit_id, "message": message})
+        else:
+            truncated += 1
+
+    rows = _hierarchy_rows(units)
+    type_by_id = {row[0]: row[1] for row in rows}
+
+    for unit_id, unit_type, parent_id, paragraph_number, point_label in rows:
+        if parent_id:
+            allowed = ALLOWED_PARENT_TYPES.get(unit_type)
+            if parent_id not in type_by_id:
+                add_issue("orphan", unit_id, f"parent_id '{parent_id}' does not exist")
+            elif allowed is not None and (parent_type := type_by_id[parent_id]) not in allowed:
+                expected_types = PARENT_TYPE_RULES[unit_type]
+                add_issue(
+                    "wrong_parent_type",
+                    unit_id,
+                    f"{unit_type} has parent type '{parent_type}', expected one of {expected_types}",
                 )
 
-        if unit_type == "point" and unit.get("point_label"):
-            expected_suffix = f".pt-{unit['point_label']}"
-            if expected_suffix not in unit_id:
-                issues.append(
-                    {
-                        "type": "id_mismatch",
-                        "id": unit_id,
-                        "message": f"point_label={unit['point_label']} doesn't match id",
-                    }
+        if unit_type == "paragraph":
+            if paragraph_number and not _id_ends_with(unit_id, f".par-{paragraph_number}"):
+                add_issue(
+                    "id_mismatch", unit_id, f"paragraph_number={paragraph_number} doesn't match id"
                 )
+        elif (
+            unit_type == "point"
+            and point_label
+            and not _id_ends_with(unit_id, f".pt-{point_label}")
+        ):
+            add_issue("id_mismatch", unit_id, f"point_label={point_label} doesn't match id")
 
-    return {"valid": len(issues) == 0, "issues": issues}
+    return {"valid": len(issues) == 0, "issues": issues, "truncated": truncated}
 
 
 def validate_ordering(units: list[dict]) -> dict:
-    """Validate that points and subparagraphs are not interleaved under the same parent."""
-    issues = []
-
-    children_by_parent: dict[str, list[dict]] = {}
-    for u in units:
-        pid = u.get("parent_id", "")
-        if pid:
-            children_by_parent.setdefault(pid, []).append(u)
-
-    for _pid, kids in children_by_parent.items():
-        types = [u["type"] for u in kids]
-        if "point" not in types or "subparagraph" not in types:
-            continue
-
-        state = "start"
-        for _i, t in enumerate(types):
-            if state == "start":
-                if t == "point":
-                    state = "points"
-                elif t == "subparagraph":
-                    state = "intro_subpar"
-            elif state == "intro_subpar":
-                if t == "point":
-                    state = "points"
-            elif state == "points":
-                if t == "subparagraph":
-                    state = "gap_subpar"
-            elif state == "gap_subpar":
-                if t == "point":
-                    state = "points"
-                elif t != "subparagraph":
-                    state = "start"
+    """
+    Validate that points and subparagraphs are not interleaved under the same parent.
 
+    Subparagraphs between point runs are accepted, so no ordering issues are reported;
+    the result keeps the ``valid``/``issues`` shape used by coverage reports.
+    """
     return {
-        "valid": len(issues) == 0,
-        "issues": issues,
+        "valid": True,
+        "issues": [],
     }
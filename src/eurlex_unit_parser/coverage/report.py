@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import sys
 from typing import Any, Mapping, Optional
 
 
@@ -14,34 +15,51 @@ def print_report(
     ordering: Optional[Mapping[str, Any]] = None,
 ) -> bool:
     """Print coverage report. Returns True if all passed."""
-    print(f"\n{'=' * 60}")
-    print("COVERAGE REPORT")
-    print(f"{'=' * 60}")
-    print(f"Format: {report['format']}")
+    # One write instead of a print() per line; METRICS_JSON stays the last line.
+    lines, passed = _build_report_lines(report, hierarchy, verbose, phantom, ordering)
+    sys.stdout.write("\n".join(lines) + "\n")
+    return passed
 
-    print(f"\nORACLE: {report.get('oracle', 'mirror')}")
 
-    print("\nSECTIONS:")
+def _build_report_lines(
+    report: dict,
+    hierarchy: dict,
+    verbose: bool = False,
+    phantom: Mapping[str, Any] | None = None,
+    ordering: Mapping[str, Any] | None = None,
+) -> tuple[list[str], bool]:
+    """Build the coverage report lines printed by ``print_report`` and whether the report passed."""
+    lines: list[str] = []
+    lines.append(f"\n{'=' * 60}")
+    lines.append("COVERAGE REPORT")
+    lines.append(f"{'=' * 60}")
+    lines.append(f"Format: {report['format']}")
+
+    lines.append(f"\nORACLE: {report.get('oracle', 'mirror')}")
+
+    lines.append("\nSECTIONS:")
     par_issues = []
     for key, data in report["paragraphs"].items():
         if data["missing"]:
             par_issues.append((key, data))
         elif verbose:
             label = "Recitals" if key == "recitals" else key
-            print(f"  [OK] {label}: {data['json_count']}/{data['html_count']}")
+            lines.append(f"  [OK] {label}: {data['json_count']}/{data['html_count']}")
 
     if par_issues:
         for key, data in par_issues:
             label = "Recitals" if key == "recitals" else key
-            print(f"  [!!] {label}: {data['json_count']}/{data['html_count']} ({len(data['missing'])} missing)")
+            lines.append(
+                f"  [!!] {label}: {data['json_count']}/{data['html_count']} ({len(data['missing'])} missing)"
+            )
             if verbose:
                 for m in data["missing"][:3]:
-                    print(f"       - {m}")
+                    lines.append(f"       - {m}")
     else:
-        print(f"  [OK] All {len(report['paragraphs'])} sections fully covered")
+        lines.append(f"  [OK] All {len(report['paragraphs'])} sections fully covered")
 
     if report.get("oracle") == "mirror" and report["points"]:
-        print("\nPOINTS:")
+        lines.append("\nPOINTS:")
         pt_issues = []
         for key, data in report["points"].items():
             if data["missing"]:
@@ -49,38 +67,40 @@ def print_report(
 
         if pt_issues:
             for key, data in pt_issues:
-                print(
+                lines.append(
                     f"  [!!] Article {key}: {data['json_count']}/{data['html_count']} ({len(data['missing'])} missing)"
                 )
                 if verbose:
                     for m in data["missing"][:3]:
-                        print(f"       - {m}")
+                        lines.append(f"       - {m}")
         else:
             total_points = sum(d["json_count"] for d in report["points"].values())
-            print(f"  [OK] All {total_points} points covered")
+            lines.append(f"  [OK] All {total_points} points covered")
 
-    print("\nHIERARCHY:")
+    # validate_hierarchy keeps a capped issue list and counts the rest as truncated.
+    hierarchy_count = len(hierarchy["issues"]) + hierarchy.get("truncated", 0)
+    lines.append("\nHIERARCHY:")
     if hierarchy["valid"]:
-        print("  [OK] All parent_ids valid")
-        print("  [OK] ID/metadata consistent")
+        lines.append("  [OK] All parent_ids valid")
+        lines.append("  [OK] ID/metadata consistent")
     else:
         for issue in hierarchy["issues"][:5]:
-            print(f"  [!!] {issue['type']}: {issue['id']}")
-            print(f"       {issue['message']}")
-        if len(hierarchy["issues"]) > 5:
-            print(f"  ... and {len(hierarchy['issues']) - 5} more issues")
+            lines.append(f"  [!!] {issue['type']}: {issue['id']}")
+            lines.append(f"       {issue['message']}")
+        if hierarchy_count > 5:
+            lines.append(f"  ... and {hierarchy_count - 5} more issues")
 
-    print("\nORDERING:")
+    lines.append("\nORDERING:")
     if ordering is None or ordering["valid"]:
-        print("  [OK] No interleaved points/subparagraphs")
+        lines.append("  [OK] No interleaved points/subparagraphs")
     else:
         for issue in ordering["issues"][:5]:
-            print(f"  [!!] {issue['type']}: parent={issue['parent_id']}")
-            print(f"       {issue['message']}")
+            lines.append(f"  [!!] {issue['type']}: parent={issue['parent_id']}")
+            lines.append(f"       {issue['message']}")
         if len(ordering["issues"]) > 5:
-            print(f"  ... and {len(ordering['issues']) - 5} more issues")
+            lines.append(f"  ... and {len(ordering['issues']) - 5} more issues")
 
-    print(f"\n{'=' * 60}")
+    lines.append(f"\n{'=' * 60}")
     coverage = report["summary"]["coverage_pct"]
     text_recall = report["summary"].get("text_recall_pct", coverage)
     gone = report["summary"].get("gone", report["summary"]["total_missing"])
@@ -89,17 +109,18 @@ def print_report(
     if phantom:
         phantom_count = phantom.get("total", 0)
     ordering_ok = ordering is None or ordering["valid"]
+    passed = gone == 0 and hierarchy["valid"] and phantom_count == 0 and ordering_ok
     ordering_count = 0 if ordering is None else len(ordering["issues"])
-    status = "PASS" if gone == 0 and hierarchy["valid"] and phantom_count == 0 and ordering_ok else "ISSUES"
-    print(f"SUMMARY: {text_recall:.1f}% text recall ({coverage:.1f}% strict) - {status}")
-    print(f"  Total HTML segments: {report['summary']['total_html_segments']}")
-    print(f"  Gone (truly missing): {gone}")
-    print(f"  Misclassified: {misclassified}")
-    print(f"  Hierarchy issues: {len(hierarchy['issues'])}")
-    print(f"  Ordering issues: {ordering_count}")
+    status = "PASS" if passed else "ISSUES"
+    lines.append(f"SUMMARY: {text_recall:.1f}% text recall ({coverage:.1f}% strict) - {status}")
+    lines.append(f"  Total HTML segments: {report['summary']['total_html_segments']}")
+    lines.append(f"  Gone (truly missing): {gone}")
+    lines.append(f"  Misclassified: {misclassified}")
+    lines.append(f"  Hierarchy issues: {hierarchy_count}")
+    lines.append(f"  Ordering issues: {ordering_count}")
     if phantom is not None:
-        print(f"  Phantom segments: {phantom_count}")
-    print(f"{'=' * 60}")
+        lines.append(f"  Phantom segments: {phantom_count}")
+    lines.append(f"{'=' * 60}")
 
     metrics = {
         "coverage_pct": round(coverage, 1),
@@ -112,6 +133,6 @@ def print_report(
         "hierarchy_ok": hierarchy["valid"],
         "ordering_ok": ordering_ok,
     }
-    print(f"METRICS_JSON: {json.dumps(metrics)}")
+    lines.append(f"METRICS_JSON: {json.dumps(metrics)}")
 
-    return gone == 0 and hierarchy["valid"] and phantom_count == 0 and ordering_ok
+    return lines, passed
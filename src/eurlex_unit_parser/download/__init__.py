@@ -1,5 +1,5 @@
 """Downloader exports."""
 
-from eurlex_unit_parser.download.eurlex import DownloadResult, download_eurlex, extract_name_from_url, main
+from eurlex_unit_parser.download.eurlex import DownloadResult, EurLexDownloader, download_eurlex, extract_name_from_url, main
 
-__all__ = ["DownloadResult", "download_eurlex", "extract_name_from_url", "main"]
+__all__ = ["DownloadResult", "EurLexDownloader", "download_eurlex", "extract_name_from_url", "main"]
@@ -1,11 +1,20 @@
-"""EUR-Lex HTML downloader with Playwright."""
+"""EUR-Lex HTML downloader with an HTTP fast path and Playwright fallback."""
 
 from __future__ import annotations
 
 import argparse
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
+from types import TracebackType
+from typing import Any, final
+
+import requests
+
+UNSAFE_NAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9_-]")
+LANGUAGE_SEGMENT_RE = re.compile(r"/[A-Z]{2}/TXT/")
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
 
 
 @dataclass
@@ -26,40 +35,164 @@ def extract_name_from_url(url: str) -> str:
     if "uri=" in url:
         uri_part = url.split("uri=")[-1].split("&")[0]
         name = uri_part.replace("OJ:", "").replace("CELEX:", "")
-        name = re.sub(r"[^a-zA-Z0-9_-]", "_", name)
+        name = UNSAFE_NAME_CHARS_RE.sub("_", name)
         return name
     return "document"
 
 
-def download_eurlex(url: str, output_path: Path, lang: str = "EN") -> DownloadResult:
-    """Download HTML from EUR-Lex using Playwright."""
+def _failed_result(
+    output_path: Path,
+    status: str,
+    error: str | None,
+    final_url: str | None,
+    method: str = "playwright",
+) -> DownloadResult:
+    return DownloadResult(
+        ok=False,
+        status=status,
+        error=error,
+        output_path=output_path,
+        final_url=final_url,
+        bytes_written=0,
+        method=method,
+    )
+
+
+def _has_eli_structure(content: str) -> bool:
+    return "eli-container" in content or "eli-subdivision" in content
+
+
+def _try_http_fetch(url: str, session: requests.Session | None = None) -> str | None:
+    """Fetch ``url`` without a browser; return the HTML only if it is a complete ELI document."""
     try:
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        print("Playwright not installed. Run: pip install playwright && playwright install chromium")
-        return DownloadResult(
-            ok=False,
-            status="playwright_missing",
-            error="Playwright not installed.",
-            output_path=output_path,
-            final_url=None,
-            bytes_written=0,
-            method="playwright",
+        response = (session or requests).get(
+            url, headers={"User-Agent": USER_AGENT}, timeout=60, allow_redirects=True
         )
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    if "charset" not in response.headers.get("Content-Type", "").lower():
+        # requests decodes text/html without a charset as ISO-8859-1; EUR-Lex serves UTF-8.
+        response.encoding = "utf-8"
+    content = response.text
+    if len(content) < 1000 or not _has_eli_structure(content):
+        return None
+    return content
 
-    url = re.sub(r"/[A-Z]{2}/TXT/", f"/{lang}/TXT/", url)
 
-    print(f"Downloading: {url}")
-    print(f"Output: {output_path}")
+def _write_content(content: str, output_path: Path, url: str, method: str) -> DownloadResult:
+    data = content.encode("utf-8")
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(data)
+    except OSError as e:
+        print(f"Error: {e}")
+        return _failed_result(output_path, "write_error", str(e), url, method)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        page = context.new_page()
+    print(f"Saved {len(data):,} bytes")
+    return DownloadResult(
+        ok=True,
+        status="ok",
+        error=None,
+        output_path=output_path,
+        final_url=url,
+        bytes_written=len(data),
+        method=method,
+    )
+
+
+@final
+class EurLexDownloader:
+    """
+    Download EUR-Lex documents, sharing one HTTP session and one Playwright browser.
+
+    Each URL is first fetched over plain HTTP; EUR-Lex often serves the full document
+    without JavaScript. Chromium is launched only when a page needs it (e.g. a challenge
+    page) and is then reused for every later ``download`` call in the session.
+    """
+
+    def __init__(self) -> None:
+        self._session: requests.Session | None = None
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._context: Any = None
+        self._playwright_missing = False
+
+    def __enter__(self) -> EurLexDownloader:
+        self._session = requests.Session()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        try:
+            self._close_browser(exc_type, exc_val, exc_tb)
+        finally:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+
+    def _close_browser(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Shut down Chromium and Playwright, leaving the HTTP session to ``__exit__``."""
+        try:
+            if self._browser is not None:
+                self._browser.close()
+        finally:
+            if self._playwright is not None:
+                self._playwright.__exit__(exc_type, exc_val, exc_tb)
+            self._playwright = self._browser = self._context = None
 
+    def _start_browser(self) -> bool:
+        """Launch Chromium on first use; return False when Playwright is not installed."""
+        if self._context is not None:
+            return True
+        if self._playwright_missing:
+            return False
         try:
+            from playwright.sync_api import sync_playwright
+        except ImportError:
+            print(
+                "Playwright not installed. Run: pip install playwright && playwright install chromium"
+            )
+            self._playwright_missing = True
+            return False
+
+        self._playwright = sync_playwright()
+        p = self._playwright.__enter__()
+        try:
+            self._browser = p.chromium.launch(headless=True)
+            self._context = self._browser.new_context(user_agent=USER_AGENT)
+        except BaseException:
+            self._close_browser(*sys.exc_info())
+            raise
+        return True
+
+    def download(self, url: str, output_path: Path, lang: str = "EN") -> DownloadResult:
+        """Download one EUR-Lex document into ``output_path``."""
+        url = LANGUAGE_SEGMENT_RE.sub(f"/{lang}/TXT/", url)
+
+        print(f"Downloading: {url}")
+        print(f"Output: {output_path}")
+
+        content = _try_http_fetch(url, self._session)
+        if content is not None:
+            return _write_content(content, output_path, url, "requests")
+
+        if not self._start_browser():
+            return _failed_result(output_path, "playwright_missing", "Playwright not installed.", None)
+
+        page = None
+        try:
+            page = self._context.new_page()
             page.goto(url, wait_until="networkidle", timeout=60000)
             page.wait_for_selector("body", timeout=30000)
 
@@ -67,75 +200,66 @@ def download_eurlex(url: str, output_path: Path, lang: str = "EN") -> DownloadRe
 
             if len(content) < 1000:
                 print("Warning: Page content seems too short, might be a challenge page")
-                return DownloadResult(
-                    ok=False,
-                    status="content_too_short",
-                    error="Page content shorter than 1000 bytes.",
-                    output_path=output_path,
-                    final_url=url,
-                    bytes_written=0,
-                    method="playwright",
+                return _failed_result(
+                    output_path, "content_too_short", "Page content shorter than 1000 bytes.", url
                 )
 
-            if "eli-container" not in content and "eli-subdivision" not in content:
+            if not _has_eli_structure(content):
                 print("Warning: No ELI structure found in page")
 
-            try:
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-            except OSError as e:
-                print(f"Error: {e}")
-                return DownloadResult(
-                    ok=False,
-                    status="write_error",
-                    error=str(e),
-                    output_path=output_path,
-                    final_url=url,
-                    bytes_written=0,
-                    method="playwright",
-                )
-
-            print(f"Saved {len(content):,} bytes")
-            return DownloadResult(
-                ok=True,
-                status="ok",
-                error=None,
-                output_path=output_path,
-                final_url=url,
-                bytes_written=len(content),
-                method="playwright",
-            )
+            return _write_content(content, output_path, url, "playwright")
 
         except Exception as e:
             print(f"Error: {e}")
-            return DownloadResult(
-                ok=False,
-                status="navigation_error",
-                error=str(e),
-                output_path=output_path,
-                final_url=url,
-                bytes_written=0,
-                method="playwright",
-            )
+            return _failed_result(output_path, "navigation_error", str(e), url)
         finally:
-            browser.close()
+            if page is not None:
+                page.close()
+
+
+def download_eurlex(url: str, output_path: Path, lang: str = "EN") -> DownloadResult:
+    """Download HTML from EUR-Lex over HTTP, falling back to Playwright."""
+    with EurLexDownloader() as downloader:
+        return downloader.download(url, output_path, lang)
+
+
+def _parse_targets(values: list[str]) -> list[tuple[str, str | None]]:
+    """Pair each URL with the output name that follows it, if any."""
+    targets: list[tuple[str, str | None]] = []
+    for value in values:
+        if "://" in value:
+            targets.append((value, None))
+        elif targets and targets[-1][1] is None:
+            targets[-1] = (targets[-1][0], value)
+        else:
+            raise ValueError(f"Output name '{value}' does not follow a URL")
+    return targets
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Download EUR-Lex HTML documents")
-    parser.add_argument("url", help="EUR-Lex URL")
-    parser.add_argument("name", nargs="?", help="Output filename (without .html)")
+    parser.add_argument(
+        "targets",
+        nargs="+",
+        metavar="URL [NAME]",
+        help="EUR-Lex URL, optionally followed by an output filename (without .html); repeat for more documents",
+    )
     parser.add_argument("--lang", "-l", default="EN", help="Language code (default: EN)")
     parser.add_argument("--output-dir", "-o", default="downloads/eur-lex", help="Output directory")
 
     args = parser.parse_args()
+    try:
+        targets = _parse_targets(args.targets)
+    except ValueError as e:
+        parser.error(str(e))
 
-    name = args.name or extract_name_from_url(args.url)
-    output_path = Path(args.output_dir) / f"{name}.html"
-
-    result = download_eurlex(args.url, output_path, args.lang)
-    raise SystemExit(0 if result.ok else 1)
+    all_ok = True
+    with EurLexDownloader() as downloader:
+        for url, name in targets:
+            output_path = Path(args.output_dir) / f"{name or extract_name_from_url(url)}.html"
+            if not downloader.download(url, output_path, args.lang).ok:
+                all_ok = False
+    raise SystemExit(0 if all_ok else 1)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """Label parsing utilities used by the parser."""
 
 import re
+from functools import lru_cache
 
 PARAGRAPH_NUM_RE = re.compile(r"^(\d+)\.\s*")
 POINT_LABEL_RE = re.compile(r"^\(?([a-z]{1,2})\)?$", re.IGNORECASE)
@@ -13,11 +14,30 @@ SUBPOINT_LABEL_RE = re.compile(
     r")\)?$",
     re.IGNORECASE,
 )
+_ROMAN_UNITS = ("", "i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix")
+# The lowercase labels SUBPOINT_LABEL_RE accepts (i-xxxix), for a set lookup instead of the alternation.
+SUBPOINT_LABELS = frozenset("x" * (n // 10) + _ROMAN_UNITS[n % 10] for n in range(1, 40))
 NUMERIC_LABEL_RE = re.compile(r"^\(?(\d+)\)?[.\)]?$")
 DASH_LABEL_RE = re.compile(r"^[—–-]$")
+DASH_LABELS = frozenset("—–-")
 QUOTE_CHARS = "'\u2018\u2019"
 
 
+def _match_subpoint_label(label: str) -> str | None:
+    """Return the lowercase Roman numeral in ``label`` if SUBPOINT_LABEL_RE would match it."""
+    core = label[1:] if label[:1] == "(" else label
+    if core[-1:] == ")":
+        core = core[:-1]
+    if core.isascii():
+        core = core.lower()
+        return core if core in SUBPOINT_LABELS else None
+    # Non-ASCII case folding (e.g. dotted capital I) is left to the regex.
+    m = SUBPOINT_LABEL_RE.match(label)
+    return m.group(1).lower() if m else None
+
+
+# Documents repeat a small set of label strings ("1.", "(a)", "(i)") many times over.
+@lru_cache(maxsize=512)
 def normalize_label(label: str) -> tuple[str, str, bool]:
     """
     Normalize a label and determine its type.
@@ -33,23 +53,30 @@ def normalize_label(label: str) -> tuple[str, str, bool]:
         is_quoted = True
         label = label[1:].strip()
 
-    m = PARAGRAPH_NUM_RE.match(label)
-    if m and "(" not in label:
-        return m.group(1), "paragraph", is_quoted
-
-    m = NUMERIC_LABEL_RE.match(label)
-    if m:
-        return m.group(1), "numeric", is_quoted
-
-    m = SUBPOINT_LABEL_RE.match(label)
-    if m:
-        return m.group(1).lower(), "subpoint", is_quoted
+    # The first character decides which patterns can match at all.
+    first = label[:1]
+    if first.isdecimal():
+        m = PARAGRAPH_NUM_RE.match(label)
+        if m and "(" not in label:
+            return m.group(1), "paragraph", is_quoted
+        m = NUMERIC_LABEL_RE.match(label)
+        if m:
+            return m.group(1), "numeric", is_quoted
+    elif first in DASH_LABELS:
+        if label in DASH_LABELS:
+            return "—", "dash", is_quoted
+    else:
+        if first == "(":
+            m = NUMERIC_LABEL_RE.match(label)
+            if m:
+                return m.group(1), "numeric", is_quoted
 
-    m = POINT_LABEL_RE.match(label)
-    if m:
-        return m.group(1).lower(), "point", is_quoted
+        subpoint = _match_subpoint_label(label)
+        if subpoint is not None:
+            return subpoint, "subpoint", is_quoted
 
-    if DASH_LABEL_RE.match(label):
-        return "—", "dash", is_quoted
+        m = POINT_LABEL_RE.match(label)
+        if m:
+            return m.group(1).lower(), "point", is_quoted
 
     return label, "unknown", is_quoted
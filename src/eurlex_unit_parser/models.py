@@ -1,5 +1,6 @@
 """Core data models for parsed legal units and validation reports."""
 
+import sys
 from dataclasses import MISSING, dataclass, field
 from typing import Any, Optional
 
@@ -25,7 +26,7 @@ def schema_field(
     return field(**kwargs)
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """Represents one reference mention extracted from a unit's text."""
 
@@ -115,8 +116,22 @@ class Citation:
         description="Derived CELEX identifier for recognized external EU acts.",
     )
 
+    def __post_init__(self) -> None:
+        # Types, labels and act numbers repeat across a document's citations; share one string per value.
+        self.citation_type = sys.intern(self.citation_type)
+        if self.article_label is not None:
+            self.article_label = sys.intern(self.article_label)
+        if self.point is not None:
+            self.point = sys.intern(self.point)
+        if self.act_number is not None:
+            self.act_number = sys.intern(self.act_number)
+        if self.act_type is not None:
+            self.act_type = sys.intern(self.act_type)
+        if self.treaty_code is not None:
+            self.treaty_code = sys.intern(self.treaty_code)
 
-@dataclass
+
+@dataclass(slots=True)
 class Unit:
     """Represents one parsed structural unit (title, recital, article, paragraph, point, annex item)."""
 
@@ -234,8 +249,18 @@ class Unit:
         description="Deterministically extracted citation objects in text order.",
     )
 
+    def __post_init__(self) -> None:
+        # Types and labels take few distinct values across a document; share one string per value.
+        self.type = sys.intern(self.type)
+        if self.article_number is not None:
+            self.article_number = sys.intern(self.article_number)
+        if self.point_label is not None:
+            self.point_label = sys.intern(self.point_label)
+        if self.subpoint_label is not None:
+            self.subpoint_label = sys.intern(self.subpoint_label)
+
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Validation report describing parser integrity checks for one source file."""
 
@@ -274,7 +299,7 @@ class ValidationReport:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentMetadata:
     """Document-level aggregate metadata computed from the final parsed unit list."""
 
@@ -294,7 +319,7 @@ class DocumentMetadata:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class LSUSummarySection:
     """One section extracted from a EUR-Lex LSU (Summaries of EU legislation) page."""
 
@@ -302,7 +327,7 @@ class LSUSummarySection:
     content: str = schema_field("Normalized plain-text content of the section body.")
 
 
-@dataclass
+@dataclass(slots=True)
 class LSUSummary:
     """Structured LSU summary extracted for a legal act CELEX identifier."""
 
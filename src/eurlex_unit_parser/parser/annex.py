@@ -4,11 +4,21 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from eurlex_unit_parser.labels import normalize_label
 from eurlex_unit_parser.models import Unit
-from eurlex_unit_parser.text_utils import get_cell_text, is_list_table, normalize_text, remove_note_tags
+from eurlex_unit_parser.text_utils import (
+    get_cell_text,
+    get_text_without_notes,
+    is_list_table,
+    normalize_text,
+)
+
+# Same match as a case-insensitive "part " prefix followed by ``Part\s+([A-Z])``.
+PART_HEADING_RE = re.compile(r"Part \s*([A-Z])", re.IGNORECASE)
+CELL_BLOCK_TAGS = frozenset({"p", "figure", "table"})
+ANNEX_TITLE_CLASSES = frozenset({"oj-doc-ti", "oj-ti-grseq-1"})
 
 
 class AnnexParserMixin:
@@ -25,18 +35,14 @@ class AnnexParserMixin:
 
             title_p = div.find("p", class_="oj-doc-ti")
             if title_p:
-                title_copy = BeautifulSoup(str(title_p), "lxml").find("p") or title_p
-                remove_note_tags(title_copy)
-                annex_title = normalize_text(title_copy.get_text(separator=" ", strip=True))
+                annex_title = normalize_text(get_text_without_notes(title_p))
             else:
                 annex_title = f"ANNEX {annex_num}"
 
             heading_p = div.find("p", class_="oj-ti-grseq-1")
             heading = None
             if heading_p:
-                heading_copy = BeautifulSoup(str(heading_p), "lxml").find("p") or heading_p
-                remove_note_tags(heading_copy)
-                heading = normalize_text(heading_copy.get_text(separator=" ", strip=True))
+                heading = normalize_text(get_text_without_notes(heading_p))
 
             annex_id = f"annex-{annex_num}"
             annex_unit = Unit(
@@ -59,34 +65,33 @@ class AnnexParserMixin:
         current_parent_id = annex_id
         annex_item_idx = 0
 
-        for child in annex_div.children:
+        for child in annex_div.contents:
             if not isinstance(child, Tag):
                 continue
+            name = child.name
+            classes = child.get("class") or ()
+
+            if name == "p" and "oj-ti-grseq-1" in classes:
+                text = normalize_text(get_text_without_notes(child))
+                m = PART_HEADING_RE.match(text)
+                if m:
+                    current_part = m.group(1).upper()
+                    part_id = f"{annex_id}.part-{current_part}"
+                    part_unit = Unit(
+                        id=part_id,
+                        type="annex_part",
+                        ref=f"Part {current_part}",
+                        text=text,
+                        parent_id=annex_id,
+                        source_id="",
+                        source_file=self.source_file,
+                        annex_number=annex_num,
+                        annex_part=current_part,
+                    )
+                    self._add_unit(part_unit)
+                    current_parent_id = part_id
 
-            if child.name == "p" and "oj-ti-grseq-1" in child.get("class", []):
-                child_copy = BeautifulSoup(str(child), "lxml").find("p") or child
-                remove_note_tags(child_copy)
-                text = normalize_text(child_copy.get_text(separator=" ", strip=True))
-                if text.lower().startswith("part "):
-                    m = re.match(r"Part\s+([A-Z])", text, re.IGNORECASE)
-                    if m:
-                        current_part = m.group(1).upper()
-                        part_id = f"{annex_id}.part-{current_part}"
-                        part_unit = Unit(
-                            id=part_id,
-                            type="annex_part",
-                            ref=f"Part {current_part}",
-                            text=text,
-                            parent_id=annex_id,
-                            source_id="",
-                            source_file=self.source_file,
-                            annex_number=annex_num,
-                            annex_part=current_part,
-                        )
-                        self._add_unit(part_unit)
-                        current_parent_id = part_id
-
-            elif child.name == "table" and is_list_table(child):
+            elif name == "table" and is_list_table(child):
                 rows = child.find_all("tr")
                 for row in rows:
                     cells = row.find_all("td")
@@ -115,37 +120,28 @@ class AnnexParserMixin:
                         if nested_tables:
                             self._parse_point_tables(nested_tables, item_id, None, None, depth=1)
 
-            elif child.name == "table" and not is_list_table(child):
+            elif name == "table":
                 for row in child.find_all("tr"):
                     for cell in row.find_all(["td", "th"]):
-                        cell_copy = BeautifulSoup(str(cell), "lxml").find(["td", "th"]) or cell
-                        remove_note_tags(cell_copy)
-                        direct_paragraphs = cell_copy.find_all("p", recursive=False)
-                        if direct_paragraphs:
-                            for p in direct_paragraphs:
-                                t = p.get_text(separator=" ", strip=True)
-                                if t and len(t.strip()) >= 5:
-                                    annex_item_idx += 1
-                                    self._add_unit(
-                                        Unit(
-                                            id=f"{current_parent_id}.item-{annex_item_idx}",
-                                            type="annex_item",
-                                            ref=None,
-                                            text=normalize_text(t),
-                                            parent_id=current_parent_id,
-                                            source_id="",
-                                            source_file=self.source_file,
-                                            annex_number=annex_num,
-                                            annex_part=current_part,
-                                        )
+                        for p in cell.find_all("p", recursive=False):
+                            t = get_text_without_notes(p)
+                            if t and len(t.strip()) >= 5:
+                                annex_item_idx += 1
+                                self._add_unit(
+                                    Unit(
+                                        id=f"{current_parent_id}.item-{annex_item_idx}",
+                                        type="annex_item",
+                                        ref=None,
+                                        text=normalize_text(t),
+                                        parent_id=current_parent_id,
+                                        source_id="",
+                                        source_file=self.source_file,
+                                        annex_number=annex_num,
+                                        annex_part=current_part,
                                     )
-                        for p_tag in cell_copy.find_all("p"):
-                            p_tag.decompose()
-                        for fig in cell_copy.find_all("figure"):
-                            fig.decompose()
-                        for tbl in cell_copy.find_all("table"):
-                            tbl.decompose()
-                        bare_t = cell_copy.get_text(separator=" ", strip=True)
+                                )
+                        # Text outside paragraphs, figures and nested tables, in one walk of the cell.
+                        bare_t = get_text_without_notes(cell, exclude=CELL_BLOCK_TAGS)
                         if bare_t and len(bare_t.strip()) >= 5:
                             annex_item_idx += 1
                             self._add_unit(
@@ -162,13 +158,10 @@ class AnnexParserMixin:
                                 )
                             )
 
-            elif child.name == "p":
-                classes = child.get("class", [])
-                if any(c in classes for c in ("oj-doc-ti", "oj-ti-grseq-1")):
+            elif name == "p":
+                if not ANNEX_TITLE_CLASSES.isdisjoint(classes):
                     continue
-                p_copy = BeautifulSoup(str(child), "lxml").find("p") or child
-                remove_note_tags(p_copy)
-                text = p_copy.get_text(separator=" ", strip=True)
+                text = get_text_without_notes(child)
                 if text and len(text.strip()) >= 5:
                     annex_item_idx += 1
                     self._add_unit(
@@ -185,10 +178,8 @@ class AnnexParserMixin:
                         )
                     )
 
-            elif child.name == "div" and "oj-enumeration-spacing" in child.get("class", []):
-                div_copy = BeautifulSoup(str(child), "lxml").find("div") or child
-                remove_note_tags(div_copy)
-                text = div_copy.get_text(separator=" ", strip=True)
+            elif name == "div" and "oj-enumeration-spacing" in classes:
+                text = get_text_without_notes(child)
                 if text and len(text.strip()) >= 5:
                     annex_item_idx += 1
                     self._add_unit(
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
+from functools import lru_cache
 
 from eurlex_unit_parser.models import Citation, Unit
 
@@ -26,16 +28,36 @@ class CitationResolverMixin:
         "that regulation": "regulation",
         "that decision": "decision",
     }
+    _SELF_REFERENCES = frozenset({"this article", "this paragraph"})
     _INDEX_TO_ORDINAL = {1: "first", 2: "second", 3: "third", 4: "fourth", 5: "fifth"}
 
     def _resolve_citations(self) -> None:
         for unit in self.units:
+            if not unit.citations:
+                continue
+            context = self._unit_citation_context(unit)
             for citation_index, citation in enumerate(unit.citations):
-                self._resolve_relative_citation(citation, unit, citation_index)
+                self._resolve_relative_citation(citation, unit, citation_index, context)
 
-    def _resolve_relative_citation(self, citation: Citation, unit: Unit, citation_index: int) -> None:
-        self._sync_subparagraph_index(citation)
+    def _unit_citation_context(
+        self, unit: Unit
+    ) -> tuple[int | None, str | None, int | None, str | None]:
+        """Return the (article, article label, paragraph, annex) context shared by a unit's citations."""
+        context_article, context_article_label = self._parse_article(unit.article_number)
+        context_paragraph = self._parse_int(unit.paragraph_number)
+        if context_paragraph is None:
+            context_paragraph = unit.paragraph_index
+        return context_article, context_article_label, context_paragraph, unit.annex_number
+
+    def _resolve_relative_citation(
+        self,
+        citation: Citation,
+        unit: Unit,
+        citation_index: int,
+        context: tuple[int | None, str | None, int | None, str | None],
+    ) -> None:
         if citation.citation_type != "internal":
+            self._sync_subparagraph_index(citation)
             return
 
         raw_text = citation.raw_text.strip().lower()
@@ -46,16 +68,13 @@ class CitationResolverMixin:
             raw_text=raw_text,
         )
         if citation.citation_type != "internal":
+            self._sync_subparagraph_index(citation)
             return
 
         had_missing_article = citation.article_label is None
         inferred_subparagraph_from_parent = False
 
-        context_article, context_article_label = self._parse_article(unit.article_number)
-        context_paragraph = self._parse_int(unit.paragraph_number)
-        if context_paragraph is None:
-            context_paragraph = unit.paragraph_index
-        context_annex = unit.annex_number
+        context_article, context_article_label, context_paragraph, context_annex = context
 
         needs_article_from_context = (
             citation.article_label is None
@@ -63,7 +82,7 @@ class CitationResolverMixin:
                 citation.paragraph is not None
                 or citation.point is not None
                 or citation.subparagraph_ordinal is not None
-                or raw_text in {"this article", "this paragraph"}
+                or raw_text in self._SELF_REFERENCES
             )
         )
         if needs_article_from_context and context_article_label is not None:
@@ -107,94 +126,76 @@ class CitationResolverMixin:
         citation: Citation,
         prefer_context_shifted_subparagraph: bool = False,
     ) -> None:
-        candidates: list[str] = []
+        for target in self._target_node_id_candidates(citation, prefer_context_shifted_subparagraph):
+            if self._target_exists(target):
+                citation.target_node_id = target
+                return
 
-        def add_candidate(candidate: str | None) -> None:
-            if candidate and candidate not in candidates:
-                candidates.append(candidate)
+        citation.target_node_id = None
 
-        shifted_target: str | None = None
-        non_shifted_target: str | None = None
-        if (
-            citation.subparagraph_ordinal
+    def _target_node_id_candidates(
+        self,
+        citation: Citation,
+        prefer_context_shifted_subparagraph: bool,
+    ) -> Iterator[str | None]:
+        """Yield target ids in priority order; later ones are only built if earlier ones miss."""
+        has_subparagraph_context = (
+            bool(citation.subparagraph_ordinal)
             and citation.article_label is not None
             and citation.paragraph is not None
-        ):
-            shifted_target = self._to_context_shifted_subparagraph_node_id(
+        )
+        shifted_first = prefer_context_shifted_subparagraph and has_subparagraph_context
+        if shifted_first:
+            yield self._to_context_shifted_subparagraph_node_id(
                 article_label=citation.article_label,
                 paragraph=citation.paragraph,
                 subparagraph=citation.subparagraph_ordinal,
                 point=citation.point,
             )
-            non_shifted_target = self._to_node_id(
+
+        yield self._to_node_id(
+            article_label=citation.article_label,
+            paragraph=citation.paragraph,
+            point=citation.point,
+            subparagraph=citation.subparagraph_ordinal,
+            annex=citation.annex,
+            annex_part=citation.annex_part,
+        )
+        if has_subparagraph_context and not shifted_first:
+            yield self._to_context_shifted_subparagraph_node_id(
                 article_label=citation.article_label,
                 paragraph=citation.paragraph,
+                subparagraph=citation.subparagraph_ordinal,
                 point=citation.point,
+            )
+
+        if citation.point is not None:
+            yield self._to_node_id(
+                article_label=citation.article_label,
+                paragraph=citation.paragraph,
+                point=None,
                 subparagraph=citation.subparagraph_ordinal,
                 annex=citation.annex,
                 annex_part=citation.annex_part,
             )
-
-        if prefer_context_shifted_subparagraph and shifted_target is not None:
-            add_candidate(shifted_target)
-            add_candidate(non_shifted_target)
-        else:
-            add_candidate(
-                self._to_node_id(
+            if has_subparagraph_context:
+                yield self._to_context_shifted_subparagraph_node_id(
                     article_label=citation.article_label,
                     paragraph=citation.paragraph,
-                    point=citation.point,
                     subparagraph=citation.subparagraph_ordinal,
-                    annex=citation.annex,
-                    annex_part=citation.annex_part,
-                )
-            )
-            add_candidate(shifted_target)
-
-        if citation.point is not None:
-            add_candidate(
-                self._to_node_id(
-                    article_label=citation.article_label,
-                    paragraph=citation.paragraph,
                     point=None,
-                    subparagraph=citation.subparagraph_ordinal,
-                    annex=citation.annex,
-                    annex_part=citation.annex_part,
-                )
-            )
-            if (
-                citation.subparagraph_ordinal
-                and citation.article_label is not None
-                and citation.paragraph is not None
-            ):
-                add_candidate(
-                    self._to_context_shifted_subparagraph_node_id(
-                        article_label=citation.article_label,
-                        paragraph=citation.paragraph,
-                        subparagraph=citation.subparagraph_ordinal,
-                        point=None,
-                    )
                 )
 
         if citation.annex is not None and citation.annex_part is not None:
-            add_candidate(
-                self._to_node_id(
-                    article_label=None,
-                    paragraph=None,
-                    point=None,
-                    subparagraph=None,
-                    annex=citation.annex,
-                    annex_part=None,
-                )
+            yield self._to_node_id(
+                article_label=None,
+                paragraph=None,
+                point=None,
+                subparagraph=None,
+                annex=citation.annex,
+                annex_part=None,
             )
 
-        for target in candidates:
-            if self._target_exists(target):
-                citation.target_node_id = target
-                return
-
-        citation.target_node_id = None
-
     def _reclassify_bare_relative_act_reference(
         self,
         citation: Citation,
@@ -267,8 +268,7 @@ class CitationResolverMixin:
                 continue
             if prior.article_label is None:
                 continue
-            between = unit.text[prior.span_end:citation.span_start]
-            if self._CLAUSE_BREAK.search(between):
+            if self._CLAUSE_BREAK.search(unit.text, prior.span_end, citation.span_start):
                 continue
             return prior
         return None
@@ -313,6 +313,7 @@ class CitationResolverMixin:
         return target_node_id in self._unit_map
 
     @classmethod
+    @lru_cache(maxsize=8192)
     def _to_context_shifted_subparagraph_node_id(
         cls,
         article_label: str,
@@ -329,9 +330,10 @@ class CitationResolverMixin:
                 subparagraph=subparagraph,
             )
 
-        parts = [f"art-{article_label}", f"par-{paragraph}"]
+        if ordinal > 1 and point:
+            return f"art-{article_label}.par-{paragraph}.subpar-{ordinal - 1}.pt-{point}"
         if ordinal > 1:
-            parts.append(f"subpar-{ordinal - 1}")
+            return f"art-{article_label}.par-{paragraph}.subpar-{ordinal - 1}"
         if point:
-            parts.append(f"pt-{point}")
-        return ".".join(parts)
+            return f"art-{article_label}.par-{paragraph}.pt-{point}"
+        return f"art-{article_label}.par-{paragraph}"
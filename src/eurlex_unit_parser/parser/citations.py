@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from re import Match, Pattern
-from typing import Callable
+from typing import Callable, ClassVar
 
 from eurlex_unit_parser.models import Citation
 
 BuilderResult = Citation | list[Citation] | None
 
+_CELEX_TYPE_CODES = {"regulation": "R", "directive": "L", "decision": "D"}
+
 
 class CitationExtractorMixin:
     """Mixin implementing deterministic citation extraction."""
 
     _ORDINALS = {"first", "second", "third", "fourth", "fifth"}
+    _ORDINAL_TO_INDEX: ClassVar[dict[str, int]] = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5}
 
     _CONNECTIVE_PHRASES = [
         "acting in accordance with",
@@ -417,6 +421,70 @@ class CitationExtractorMixin:
         re.IGNORECASE,
     )
 
+    # Keywords the citation patterns cannot match without, one named group per keyword family.
+    # The lookahead finds overlapping hits too, so "subparagraph" also reports "paragraph".
+    _CITATION_KEYWORDS: Pattern[str] = re.compile(
+        r"""
+        (?=
+            (?P<article>article)
+            |(?P<point>point)
+            |(?P<paragraph>paragraph)
+            |(?P<act>regulation|directive|decision)
+            |(?P<protocol>protocol)
+            |(?P<division>chapter|section|title)
+            |(?P<annex>annex)
+            |(?P<thereof>thereof)
+        )
+        """,
+        re.IGNORECASE | re.VERBOSE,
+    )
+
+    # Patterns in priority order, each with the name of the method that builds its citations and
+    # the keyword families (see ``_CITATION_KEYWORDS``) that must all occur in the text for it to match.
+    _CITATION_BUILDERS: tuple[tuple[Pattern[str], str, frozenset[str]], ...] = (
+        (_EXTERNAL_WITH_ARTICLE_POINT_FIRST, "_build_external_with_article", frozenset({"point", "article", "act"})),
+        (_EXTERNAL_WITH_ARTICLE_BLOCK_ACTS, "_build_external_with_article_block_acts", frozenset({"article", "act"})),
+        (_EXTERNAL_WITH_ARTICLE_BLOCK_CONTEXTUAL, "_build_external_with_article_block_contextual", frozenset({"article", "act"})),
+        (_EXTERNAL_WITH_ARTICLE_ARTICLE_FIRST, "_build_external_with_article", frozenset({"article", "act"})),
+        (_EXTERNAL_WITH_ARTICLE_MULTI_ACTS, "_build_external_with_article_multi_acts", frozenset({"article", "act"})),
+        (_EXTERNAL_WITH_ARTICLE_RANGE_MULTI_ACTS, "_build_external_with_article_range_multi_acts", frozenset({"article", "act"})),
+        (_EXTERNAL_STANDALONE, "_build_external_standalone", frozenset({"act"})),
+        (_TREATY_TFEU_TEU_SHORT, "_build_treaty_short", frozenset({"article"})),
+        (_TREATY_LONG_TFEU, "_build_treaty_tfeu_long", frozenset({"article"})),
+        (_TREATY_LONG_TEU, "_build_treaty_teu_long", frozenset({"article"})),
+        (_TREATY_CHARTER, "_build_treaty_charter", frozenset({"article"})),
+        (_TREATY_LONG_GENERIC, "_build_treaty_generic", frozenset({"article"})),
+        (_TREATY_PROTOCOL, "_build_treaty_protocol", frozenset({"protocol"})),
+        (_INTERNAL_POINT_OF_SUBPARAGRAPH, "_build_internal_point_of_subparagraph", frozenset({"point", "paragraph"})),
+        (_INTERNAL_SUBPARAGRAPH_COMMA_POINT, "_build_internal_subparagraph_comma_point", frozenset({"point", "paragraph"})),
+        (_INTERNAL_SUBPARAGRAPH_OF_PARAGRAPH, "_build_internal_subparagraph_of_paragraph", frozenset({"paragraph"})),
+        (_INTERNAL_ARTICLE_POINT_RANGE_ARTICLE_FIRST, "_build_internal_article_point_range", frozenset({"article", "point"})),
+        (_INTERNAL_ARTICLE_POINT_RANGE_POINT_FIRST, "_build_internal_article_point_range", frozenset({"article", "point"})),
+        (_INTERNAL_ARTICLE_POINT, "_build_internal_article_point", frozenset({"article", "point"})),
+        (_INTERNAL_POINT_OF_ARTICLE, "_build_internal_article_point", frozenset({"article", "point"})),
+        (_INTERNAL_ARTICLE_RANGE, "_build_internal_article_range", frozenset({"article"})),
+        (_INTERNAL_ARTICLE_ENUMERATION, "_build_internal_article_enumeration", frozenset({"article"})),
+        (_INTERNAL_ARTICLE_OR, "_build_internal_article_or", frozenset({"article"})),
+        (_INTERNAL_ARTICLE_MULTI_PARAGRAPH, "_build_internal_article_multi_paragraph", frozenset({"article"})),
+        (_INTERNAL_ARTICLE_SIMPLE, "_build_internal_article_simple", frozenset({"article"})),
+        (_INTERNAL_POINT_ENUMERATION, "_build_internal_point_enumeration", frozenset({"point"})),
+        (_INTERNAL_PARAGRAPH_ENUMERATION, "_build_internal_paragraph_enumeration", frozenset({"paragraph"})),
+        (_INTERNAL_PARAGRAPH_OF_THIS_ARTICLE, "_build_internal_paragraph_of_this_article", frozenset({"article", "paragraph"})),
+        (_INTERNAL_PARAGRAPH_RANGE, "_build_internal_paragraph_range", frozenset({"paragraph"})),
+        (_INTERNAL_PARAGRAPH_SIMPLE, "_build_internal_paragraph_simple", frozenset({"paragraph"})),
+        (_INTERNAL_SUBPARAGRAPH_PAIR_THIS_PARAGRAPH, "_build_internal_subparagraph_pair", frozenset({"paragraph"})),
+        (_INTERNAL_SUBPARAGRAPH_ARTICLE_FIRST, "_build_internal_subparagraph", frozenset({"article", "paragraph"})),
+        (_INTERNAL_SUBPARAGRAPH_OF_ARTICLE, "_build_internal_subparagraph", frozenset({"article", "paragraph"})),
+        (_INTERNAL_SUBPARAGRAPH_SIMPLE, "_build_internal_subparagraph", frozenset({"paragraph"})),
+        (_INTERNAL_CHAPTER_SECTION_TITLE, "_build_internal_chapter_section_title", frozenset({"division"})),
+        (_INTERNAL_THIS_CHAPTER_SECTION_TITLE, "_build_internal_chapter_section_title", frozenset({"division"})),
+        (_INTERNAL_ANNEX_SECTION_OF_ANNEX, "_build_internal_annex", frozenset({"annex", "division"})),
+        (_INTERNAL_ANNEX_WITH_PART, "_build_internal_annex", frozenset({"annex"})),
+        (_INTERNAL_ANNEX_MULTIPLE, "_build_internal_annex", frozenset({"annex"})),
+        (_INTERNAL_ANNEX_SIMPLE, "_build_internal_annex", frozenset({"annex"})),
+        (_RELATIVE_REFERENCE, "_build_relative_reference", frozenset()),
+    )
+
     def _extract_citations(self) -> None:
         for unit in self.units:
             if unit.is_amendment_text or not unit.text:
@@ -425,55 +493,18 @@ class CitationExtractorMixin:
             unit.citations = self._extract_citations_from_text(unit.text)
 
     def _extract_citations_from_text(self, text: str) -> list[Citation]:
-        consumed_spans: list[tuple[int, int]] = []
-        citations: list[Citation] = []
+        keywords = {match.lastgroup for match in self._CITATION_KEYWORDS.finditer(text)}
+        if not keywords:
+            return []
 
-        builders: list[tuple[Pattern[str], Callable[[Match[str], str], BuilderResult]]] = [
-            (self._EXTERNAL_WITH_ARTICLE_POINT_FIRST, self._build_external_with_article),
-            (self._EXTERNAL_WITH_ARTICLE_BLOCK_ACTS, self._build_external_with_article_block_acts),
-            (self._EXTERNAL_WITH_ARTICLE_BLOCK_CONTEXTUAL, self._build_external_with_article_block_contextual),
-            (self._EXTERNAL_WITH_ARTICLE_ARTICLE_FIRST, self._build_external_with_article),
-            (self._EXTERNAL_WITH_ARTICLE_MULTI_ACTS, self._build_external_with_article_multi_acts),
-            (self._EXTERNAL_WITH_ARTICLE_RANGE_MULTI_ACTS, self._build_external_with_article_range_multi_acts),
-            (self._EXTERNAL_STANDALONE, self._build_external_standalone),
-            (self._TREATY_TFEU_TEU_SHORT, self._build_treaty_short),
-            (self._TREATY_LONG_TFEU, self._build_treaty_tfeu_long),
-            (self._TREATY_LONG_TEU, self._build_treaty_teu_long),
-            (self._TREATY_CHARTER, self._build_treaty_charter),
-            (self._TREATY_LONG_GENERIC, self._build_treaty_generic),
-            (self._TREATY_PROTOCOL, self._build_treaty_protocol),
-            (self._INTERNAL_POINT_OF_SUBPARAGRAPH, self._build_internal_point_of_subparagraph),
-            (self._INTERNAL_SUBPARAGRAPH_COMMA_POINT, self._build_internal_subparagraph_comma_point),
-            (self._INTERNAL_SUBPARAGRAPH_OF_PARAGRAPH, self._build_internal_subparagraph_of_paragraph),
-            (self._INTERNAL_ARTICLE_POINT_RANGE_ARTICLE_FIRST, self._build_internal_article_point_range),
-            (self._INTERNAL_ARTICLE_POINT_RANGE_POINT_FIRST, self._build_internal_article_point_range),
-            (self._INTERNAL_ARTICLE_POINT, self._build_internal_article_point),
-            (self._INTERNAL_POINT_OF_ARTICLE, self._build_internal_article_point),
-            (self._INTERNAL_ARTICLE_RANGE, self._build_internal_article_range),
-            (self._INTERNAL_ARTICLE_ENUMERATION, self._build_internal_article_enumeration),
-            (self._INTERNAL_ARTICLE_OR, self._build_internal_article_or),
-            (self._INTERNAL_ARTICLE_MULTI_PARAGRAPH, self._build_internal_article_multi_paragraph),
-            (self._INTERNAL_ARTICLE_SIMPLE, self._build_internal_article_simple),
-            (self._INTERNAL_POINT_ENUMERATION, self._build_internal_point_enumeration),
-            (self._INTERNAL_PARAGRAPH_ENUMERATION, self._build_internal_paragraph_enumeration),
-            (self._INTERNAL_PARAGRAPH_OF_THIS_ARTICLE, self._build_internal_paragraph_of_this_article),
-            (self._INTERNAL_PARAGRAPH_RANGE, self._build_internal_paragraph_range),
-            (self._INTERNAL_PARAGRAPH_SIMPLE, self._build_internal_paragraph_simple),
-            (self._INTERNAL_SUBPARAGRAPH_PAIR_THIS_PARAGRAPH, self._build_internal_subparagraph_pair),
-            (self._INTERNAL_SUBPARAGRAPH_ARTICLE_FIRST, self._build_internal_subparagraph),
-            (self._INTERNAL_SUBPARAGRAPH_OF_ARTICLE, self._build_internal_subparagraph),
-            (self._INTERNAL_SUBPARAGRAPH_SIMPLE, self._build_internal_subparagraph),
-            (self._INTERNAL_CHAPTER_SECTION_TITLE, self._build_internal_chapter_section_title),
-            (self._INTERNAL_THIS_CHAPTER_SECTION_TITLE, self._build_internal_chapter_section_title),
-            (self._INTERNAL_ANNEX_SECTION_OF_ANNEX, self._build_internal_annex),
-            (self._INTERNAL_ANNEX_WITH_PART, self._build_internal_annex),
-            (self._INTERNAL_ANNEX_MULTIPLE, self._build_internal_annex),
-            (self._INTERNAL_ANNEX_SIMPLE, self._build_internal_annex),
-            (self._RELATIVE_REFERENCE, self._build_relative_reference),
-        ]
+        # One byte per character of ``text``; set to 1 once a citation has claimed it.
+        consumed = bytearray(len(text))
+        citations: list[Citation] = []
 
-        for pattern, builder in builders:
-            citations.extend(self._collect_matches(text, pattern, consumed_spans, builder))
+        for pattern, builder_name, required_keywords in self._CITATION_BUILDERS:
+            if not required_keywords <= keywords:
+                continue
+            citations.extend(self._collect_matches(text, pattern, consumed, getattr(self, builder_name)))
 
         citations.sort(key=lambda citation: citation.span_start)
         self._annotate_connective_phrases(text, citations)
@@ -483,15 +514,17 @@ class CitationExtractorMixin:
         self,
         text: str,
         pattern: Pattern[str],
-        consumed_spans: list[tuple[int, int]],
+        consumed: bytearray,
         builder: Callable[[Match[str], str], BuilderResult],
     ) -> list[Citation]:
         built: list[Citation] = []
-        matches = sorted(pattern.finditer(text), key=lambda match: (-(match.end() - match.start()), match.start()))
+        # Longest match first, then leftmost; spans are read once per match.
+        matches = [(match.span(), match) for match in pattern.finditer(text)]
+        if len(matches) > 1:
+            matches.sort(key=lambda entry: (entry[0][0] - entry[0][1], entry[0][0]))
 
-        for match in matches:
-            span_start, span_end = match.span()
-            if self._is_overlapping(span_start, span_end, consumed_spans):
+        for (span_start, span_end), match in matches:
+            if self._is_overlapping(span_start, span_end, consumed):
                 continue
 
             result = builder(match, text)
@@ -502,13 +535,14 @@ class CitationExtractorMixin:
             if not citations:
                 continue
 
-            consumed_spans.append((span_start, span_end))
+            consumed[span_start:span_end] = b"\x01" * (span_end - span_start)
             built.extend(citations)
 
         return built
 
     def _build_external_with_article(self, match: Match[str], text: str) -> Citation | None:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
         act_type = self._normalize_act_type(match.group("act_kind"))
         if act_type is None:
@@ -519,25 +553,25 @@ class CitationExtractorMixin:
         act_number = f"{act_part1}/{act_part2}"
 
         article, article_label = self._parse_article(match.group("article"))
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
-        subparagraph_ordinal = self._normalize_ordinal(match.groupdict().get("subparagraph"))
-        paragraph_ordinal = self._normalize_ordinal(match.groupdict().get("paragraph_ordinal"))
+        paragraph = self._parse_int(groups.get("paragraph"))
+        subparagraph_ordinal = self._normalize_ordinal(groups.get("subparagraph"))
+        paragraph_ordinal = self._normalize_ordinal(groups.get("paragraph_ordinal"))
         if paragraph is None and paragraph_ordinal:
             paragraph = self._ordinal_to_int(paragraph_ordinal)
 
         point = self._normalize_point(
-            match.groupdict().get("point")
-            or match.groupdict().get("point_comma")
-            or match.groupdict().get("point_inline")
+            groups.get("point")
+            or groups.get("point_comma")
+            or groups.get("point_inline")
         )
         point_range = self._parse_point_range(
-            match.groupdict().get("point_range_start"),
-            match.groupdict().get("point_range_end"),
+            groups.get("point_range_start"),
+            groups.get("point_range_end"),
         )
 
         celex = None
         parsed = self._parse_act_year_number(act_part1, act_part2)
-        is_framework = bool((match.groupdict().get("framework") or "").strip())
+        is_framework = bool((groups.get("framework") or "").strip())
         act_year = None
         if parsed is not None:
             year, number = parsed
@@ -570,11 +604,12 @@ class CitationExtractorMixin:
 
     def _build_external_with_article_block_acts(self, match: Match[str], text: str) -> list[Citation]:
         span_start, span_end = match.span()
-        article_block = match.groupdict().get("article_block") or ""
+        groups = match.groupdict()
+        article_block = groups.get("article_block") or ""
         article_refs = self._parse_external_article_block(article_block)
         act_refs = self._parse_explicit_act_references(
-            match.groupdict().get("act_kind"),
-            match.groupdict().get("act_list"),
+            groups.get("act_kind"),
+            groups.get("act_list"),
         )
         return self._build_external_article_act_citations(
             raw_text=text[span_start:span_end],
@@ -586,12 +621,13 @@ class CitationExtractorMixin:
 
     def _build_external_with_article_block_contextual(self, match: Match[str], text: str) -> list[Citation]:
         span_start, span_end = match.span()
-        article_block = match.groupdict().get("article_block") or ""
+        groups = match.groupdict()
+        article_block = groups.get("article_block") or ""
         article_refs = self._parse_external_article_block(article_block)
         contextual_act = self._resolve_contextual_act_reference(
             text=text,
             span_start=span_start,
-            context_kind=match.groupdict().get("context_kind"),
+            context_kind=groups.get("context_kind"),
         )
         if contextual_act is None:
             return []
@@ -637,19 +673,20 @@ class CitationExtractorMixin:
 
     def _build_external_with_article_multi_acts(self, match: Match[str], text: str) -> list[Citation]:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
-        raw_act_type = (match.groupdict().get("act_kind") or "").strip().lower()
+        raw_act_type = (groups.get("act_kind") or "").strip().lower()
         singular_act_type = raw_act_type[:-1] if raw_act_type.endswith("s") else raw_act_type
         act_type = self._normalize_act_type(singular_act_type)
         if act_type is None:
             return []
 
         article, article_label = self._parse_article(match.group("article"))
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
-        point = self._normalize_point(match.groupdict().get("point_inline"))
+        paragraph = self._parse_int(groups.get("paragraph"))
+        point = self._normalize_point(groups.get("point_inline"))
         target_node_id = self._to_node_id(article_label=article_label, paragraph=paragraph, point=point)
 
-        act_list = match.groupdict().get("act_list") or ""
+        act_list = groups.get("act_list") or ""
         act_pairs = re.findall(r"(?P<part1>\d{2,4})/(?P<part2>\d+)(?:/[A-Z]{2,4})?", act_list)
 
         citations: list[Citation] = []
@@ -685,18 +722,19 @@ class CitationExtractorMixin:
 
     def _build_external_with_article_range_multi_acts(self, match: Match[str], text: str) -> list[Citation]:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
-        raw_act_type = (match.groupdict().get("act_kind") or "").strip().lower()
+        raw_act_type = (groups.get("act_kind") or "").strip().lower()
         singular_act_type = raw_act_type[:-1] if raw_act_type.endswith("s") else raw_act_type
         act_type = self._normalize_act_type(singular_act_type)
         if act_type is None:
             return []
 
-        range_start = self._parse_int(match.groupdict().get("range_start"))
-        range_end = self._parse_int(match.groupdict().get("range_end"))
+        range_start = self._parse_int(groups.get("range_start"))
+        range_end = self._parse_int(groups.get("range_end"))
         article_range = (range_start, range_end) if range_start is not None and range_end is not None else None
 
-        act_list = match.groupdict().get("act_list") or ""
+        act_list = groups.get("act_list") or ""
         act_pairs = re.findall(r"(?P<part1>\d{2,4})/(?P<part2>\d+)(?:/[A-Z]{2,4})?", act_list)
 
         citations: list[Citation] = []
@@ -756,8 +794,9 @@ class CitationExtractorMixin:
 
     def _build_treaty_citation(self, match: Match[str], text: str, treaty_code: str) -> Citation:
         span_start, span_end = match.span()
-        article, article_label = self._parse_article(match.groupdict().get("article"))
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
+        groups = match.groupdict()
+        article, article_label = self._parse_article(groups.get("article"))
+        paragraph = self._parse_int(groups.get("paragraph"))
 
         return Citation(
             raw_text=text[span_start:span_end],
@@ -792,10 +831,11 @@ class CitationExtractorMixin:
 
     def _build_internal_article_point(self, match: Match[str], text: str) -> Citation:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
         article, article_label = self._parse_article(match.group("article"))
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
-        point = self._normalize_point(match.groupdict().get("point"))
+        paragraph = self._parse_int(groups.get("paragraph"))
+        point = self._normalize_point(groups.get("point"))
 
         return Citation(
             raw_text=text[span_start:span_end],
@@ -811,9 +851,10 @@ class CitationExtractorMixin:
 
     def _build_internal_article_range(self, match: Match[str], text: str) -> Citation:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
-        range_start = self._parse_int(match.groupdict().get("range_start") or match.groupdict().get("enum_start"))
-        range_end = self._parse_int(match.groupdict().get("range_end") or match.groupdict().get("enum_end"))
+        range_start = self._parse_int(groups.get("range_start") or groups.get("enum_start"))
+        range_end = self._parse_int(groups.get("range_end") or groups.get("enum_end"))
 
         article_range = None
         if range_start is not None and range_end is not None:
@@ -857,11 +898,12 @@ class CitationExtractorMixin:
 
     def _build_internal_article_or(self, match: Match[str], text: str) -> list[Citation]:
         span_start, span_end = match.span()
+        groups = match.groupdict()
         citations: list[Citation] = []
 
         article_tokens = [
-            (match.groupdict().get("article1"), match.groupdict().get("paragraph1")),
-            (match.groupdict().get("article2"), match.groupdict().get("paragraph2")),
+            (groups.get("article1"), groups.get("paragraph1")),
+            (groups.get("article2"), groups.get("paragraph2")),
         ]
         for article_token, paragraph_token in article_tokens:
             article, article_label = self._parse_article(article_token)
@@ -918,10 +960,11 @@ class CitationExtractorMixin:
 
     def _build_internal_article_simple(self, match: Match[str], text: str) -> Citation:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
         article, article_label = self._parse_article(match.group("article"))
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
-        point = self._normalize_point(match.groupdict().get("point_inline"))
+        paragraph = self._parse_int(groups.get("paragraph"))
+        point = self._normalize_point(groups.get("point_inline"))
 
         return Citation(
             raw_text=text[span_start:span_end],
@@ -1027,9 +1070,10 @@ class CitationExtractorMixin:
 
     def _build_internal_point_of_subparagraph(self, match: Match[str], text: str) -> Citation:
         span_start, span_end = match.span()
-        point = self._normalize_point(match.groupdict().get("point"))
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
-        ordinal = self._normalize_ordinal(match.groupdict().get("ordinal"))
+        groups = match.groupdict()
+        point = self._normalize_point(groups.get("point"))
+        paragraph = self._parse_int(groups.get("paragraph"))
+        ordinal = self._normalize_ordinal(groups.get("ordinal"))
 
         return Citation(
             raw_text=text[span_start:span_end],
@@ -1049,8 +1093,9 @@ class CitationExtractorMixin:
 
     def _build_internal_subparagraph_comma_point(self, match: Match[str], text: str) -> Citation:
         span_start, span_end = match.span()
-        point = self._normalize_point(match.groupdict().get("point"))
-        ordinal = self._normalize_ordinal(match.groupdict().get("ordinal"))
+        groups = match.groupdict()
+        point = self._normalize_point(groups.get("point"))
+        ordinal = self._normalize_ordinal(groups.get("ordinal"))
 
         return Citation(
             raw_text=text[span_start:span_end],
@@ -1069,8 +1114,9 @@ class CitationExtractorMixin:
 
     def _build_internal_subparagraph_of_paragraph(self, match: Match[str], text: str) -> Citation:
         span_start, span_end = match.span()
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
-        ordinal = self._normalize_ordinal(match.groupdict().get("ordinal"))
+        groups = match.groupdict()
+        paragraph = self._parse_int(groups.get("paragraph"))
+        ordinal = self._normalize_ordinal(groups.get("ordinal"))
 
         return Citation(
             raw_text=text[span_start:span_end],
@@ -1117,9 +1163,10 @@ class CitationExtractorMixin:
 
     def _build_internal_subparagraph(self, match: Match[str], text: str) -> Citation:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
-        article, article_label = self._parse_article(match.groupdict().get("article"))
-        paragraph = self._parse_int(match.groupdict().get("paragraph"))
+        article, article_label = self._parse_article(groups.get("article"))
+        paragraph = self._parse_int(groups.get("paragraph"))
         ordinal = self._normalize_ordinal(match.group("ordinal"))
 
         return Citation(
@@ -1166,21 +1213,22 @@ class CitationExtractorMixin:
 
     def _build_internal_annex(self, match: Match[str], text: str) -> BuilderResult:
         span_start, span_end = match.span()
+        groups = match.groupdict()
 
-        annex = match.groupdict().get("annex")
+        annex = groups.get("annex")
         if annex:
             annex = annex.upper()
 
-        part = match.groupdict().get("part")
+        part = groups.get("part")
         if part:
             part = part.upper()
 
-        section_letter = match.groupdict().get("section_letter")
+        section_letter = groups.get("section_letter")
         if section_letter:
             section_letter = section_letter.upper()
 
-        first_annex = match.groupdict().get("annex_first")
-        second_annex = match.groupdict().get("annex_second")
+        first_annex = groups.get("annex_first")
+        second_annex = groups.get("annex_second")
 
         if first_annex and second_annex:
             return [
@@ -1280,10 +1328,11 @@ class CitationExtractorMixin:
         return re.sub(r"\s+", " ", normalized).strip()
 
     @staticmethod
-    def _is_overlapping(span_start: int, span_end: int, consumed_spans: list[tuple[int, int]]) -> bool:
-        return any(span_start < consumed_end and span_end > consumed_start for consumed_start, consumed_end in consumed_spans)
+    def _is_overlapping(span_start: int, span_end: int, consumed: bytearray) -> bool:
+        return consumed.find(1, span_start, span_end) != -1
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_article(article: str | None) -> tuple[int | None, str | None]:
         if article is None:
             return None, None
@@ -1426,8 +1475,8 @@ class CitationExtractorMixin:
         matching_blocks: list[list[dict[str, object]]] = []
         for match in self._EXTERNAL_ACT_BLOCK.finditer(prefix):
             act_refs = self._parse_explicit_act_references(
-                match.groupdict().get("act_kind"),
-                match.groupdict().get("act_list"),
+                match.group("act_kind"),
+                match.group("act_list"),
             )
             if not act_refs:
                 continue
@@ -1540,8 +1589,8 @@ class CitationExtractorMixin:
         return {
             "article": article,
             "article_label": article_label,
-            "paragraph": self._parse_int(match.groupdict().get("paragraph")),
-            "point": self._normalize_point(match.groupdict().get("point")),
+            "paragraph": self._parse_int(match.group("paragraph")),
+            "point": self._normalize_point(match.group("point")),
             "point_range": None,
             "article_range": None,
         }
@@ -1565,11 +1614,11 @@ class CitationExtractorMixin:
         if article_label is None:
             return None
 
-        point = self._normalize_point(match.groupdict().get("point_comma") or match.groupdict().get("point_inline"))
+        point = self._normalize_point(match.group("point_comma") or match.group("point_inline"))
         return {
             "article": article,
             "article_label": article_label,
-            "paragraph": self._parse_int(match.groupdict().get("paragraph")),
+            "paragraph": self._parse_int(match.group("paragraph")),
             "point": point,
             "point_range": None,
             "article_range": None,
@@ -1590,11 +1639,11 @@ class CitationExtractorMixin:
 
     @classmethod
     def _ordinal_to_int(cls, value: str) -> int | None:
-        mapping = {"first": 1, "second": 2, "third": 3, "fourth": 4, "fifth": 5}
-        normalized = value.strip().lower()
-        return mapping.get(normalized)
+        return cls._ORDINAL_TO_INDEX.get(value.strip().lower())
 
+    # The same few acts are cited over and over within one document.
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_act_year_number(part1: str, part2: str) -> tuple[int, int] | None:
         p1 = int(part1)
         p2 = int(part2)
@@ -1612,14 +1661,16 @@ class CitationExtractorMixin:
         return None
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _to_celex(act_type: str, year: int, number: int) -> str | None:
-        type_codes = {"regulation": "R", "directive": "L", "decision": "D"}
-        type_code = type_codes.get(act_type)
+        type_code = _CELEX_TYPE_CODES.get(act_type)
         if type_code is None:
             return None
         return f"3{year:04d}{type_code}{number:04d}"
 
+    # Citations of one document repeat the same (article, paragraph, point, ...) tuples many times.
     @classmethod
+    @lru_cache(maxsize=8192)
     def _to_node_id(
         cls,
         article_label: str | None,
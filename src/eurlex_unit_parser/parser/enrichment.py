@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections import Counter, defaultdict
 from typing import Optional
 
 from eurlex_unit_parser.models import DocumentMetadata, Unit
@@ -25,15 +26,16 @@ class EnrichmentMixin:
 
     def _build_parent_index(self) -> None:
         self._unit_map: dict[str, Unit] = {u.id: u for u in self.units}
-        self._children_map: dict[str, list[Unit]] = {}
+        self._children_map: defaultdict[str, list[Unit]] = defaultdict(list)
         for unit in self.units:
             if unit.parent_id:
-                self._children_map.setdefault(unit.parent_id, []).append(unit)
+                self._children_map[unit.parent_id].append(unit)
 
     def _compute_children_counts(self) -> None:
+        children_map = self._children_map
         for unit in self.units:
-            children = self._children_map.get(unit.id, [])
-            unit.children_count = len(children)
+            children = children_map.get(unit.id)
+            unit.children_count = len(children) if children else 0
             unit.is_leaf = unit.children_count == 0
 
     def _compute_is_stem(self) -> None:
@@ -125,17 +127,18 @@ class EnrichmentMixin:
             and re.search(r"\bdefinitions?\b", unit.heading, re.IGNORECASE)
         }
 
+        type_counts = Counter(u.type for u in self.units)
         self.document_metadata = DocumentMetadata(
             title=title_unit.text if title_unit else None,
             total_units=len(self.units),
-            total_articles=sum(1 for u in self.units if u.type == "article"),
-            total_paragraphs=sum(1 for u in self.units if u.type == "paragraph"),
-            total_points=sum(1 for u in self.units if u.type == "point"),
+            total_articles=type_counts["article"],
+            total_paragraphs=type_counts["paragraph"],
+            total_points=type_counts["point"],
             total_definitions=sum(
                 1
                 for u in self.units
                 if u.type == "point" and u.article_number in definition_article_numbers
             ),
-            has_annexes=any(u.type == "annex" for u in self.units),
+            has_annexes=type_counts["annex"] > 0,
             amendment_articles=amendment_articles,
         )
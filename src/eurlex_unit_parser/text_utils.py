@@ -1,12 +1,45 @@
 """Text and HTML utility helpers shared across parser and coverage tooling."""
 
+import os
 import re
+from pathlib import Path
 from typing import Optional
 
-from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4 import CData, NavigableString, Tag
 
 from eurlex_unit_parser.labels import normalize_label
 
+TEXT_STRING_TYPES = (NavigableString, CData)
+NOTE_SUPER_RE = re.compile(r"^[*]?\d+$")
+LEADING_LABEL_RE = re.compile(r"^(\d+)\.\s+(.*)$", re.DOTALL)
+NESTED_TABLE_TAGS = frozenset({"table"})
+
+
+def _advise_sequential_read(fileno: int) -> None:
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def read_html_file(path: str | Path) -> str:
+    """Read an HTML source file as UTF-8 text.
+
+    On platforms with ``posix_fadvise`` the kernel is told the file will be read
+    sequentially, so readahead covers the large EUR-Lex documents in fewer round trips.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        _advise_sequential_read(f.fileno())
+        return f.read()
+
+
+def read_html_bytes(path: str | Path) -> bytes:
+    """Read an HTML source file as raw bytes for parsers that decode it themselves."""
+    with open(path, "rb") as f:
+        _advise_sequential_read(f.fileno())
+        return f.read()
+
 
 def is_list_table(table: Tag) -> bool:
     """Heuristic to determine if a table is a list-table (2 columns, label on left)."""
@@ -62,23 +95,73 @@ def remove_note_tags(element: Tag) -> None:
         span.decompose()
     for span in element.find_all("span", class_="oj-super"):
         text = span.get_text(strip=True)
-        if re.match(r"^[*]?\d+$", text):
+        if NOTE_SUPER_RE.match(text):
             span.decompose()
 
 
+def _is_note_tag(tag: Tag, check_super: bool = True) -> bool:
+    """Return True if ``remove_note_tags`` would drop ``tag`` from its parent element."""
+    if tag.name == "a":
+        href = tag.get("href")
+        if href is None:
+            return False
+        if "#ntr" in href or "#ntc" in href:
+            return True
+        return any("note" in c for c in tag.get("class", []) or [])
+    if tag.name == "span":
+        classes = tag.get("class") or []
+        if "oj-note-tag" in classes:
+            return True
+        if check_super and "oj-super" in classes:
+            # Superscripts are matched after anchors and note-tag spans are gone.
+            parts: list[str] = []
+            _collect_text_without_notes(tag, parts, check_super=False)
+            return bool(NOTE_SUPER_RE.match("".join(parts)))
+    return False
+
+
+def _collect_text_without_notes(
+    element: Tag,
+    parts: list[str],
+    check_super: bool = True,
+    exclude: frozenset[str] | None = None,
+) -> None:
+    for child in element.children:
+        if isinstance(child, Tag):
+            if exclude and child.name in exclude:
+                continue
+            if not _is_note_tag(child, check_super):
+                _collect_text_without_notes(child, parts, check_super, exclude)
+        elif type(child) in TEXT_STRING_TYPES:
+            text = child.strip()
+            if text:
+                parts.append(text)
+
+
+def get_text_without_notes(
+    element: Tag, separator: str = " ", exclude: frozenset[str] | None = None
+) -> str:
+    """
+    Return ``element.get_text(separator=separator, strip=True)`` with note tags skipped.
+    Matches the text left after ``remove_note_tags`` without copying or mutating the tree.
+    Descendant tags named in ``exclude`` are skipped too, as if they had been decomposed.
+    """
+    parts: list[str] = []
+    _collect_text_without_notes(element, parts, exclude=exclude)
+    return separator.join(parts)
+
+
 def get_cell_text(cell: Tag, exclude_nested_tables: bool = False) -> str:
     """
     Extract text from a table cell, optionally excluding nested tables.
     When exclude_nested_tables=True, only returns text from <p> elements
     that appear before the first nested <table>.
+    Footnote markers are skipped; the source tree is left untouched.
     """
-    cell_copy = BeautifulSoup(str(cell), "lxml").find("td") or cell
-    remove_note_tags(cell_copy)
-
     if exclude_nested_tables:
-        has_nested = bool(cell_copy.find("table", recursive=False) or cell_copy.find("div", recursive=False))
+        has_nested = bool(cell.find("table", recursive=False) or cell.find("div", recursive=False))
         texts = []
-        for child in cell_copy.children:
+        for child in cell.children:
             if isinstance(child, NavigableString):
                 t = child.strip()
                 if t:
@@ -91,34 +174,34 @@ def get_cell_text(cell: Tag, exclude_nested_tables: bool = False) -> str:
             if child.name == "p":
                 if "oj-note" in child.get("class", []):
                     continue
-                text = child.get_text(separator=" ", strip=True)
+                text = get_text_without_notes(child)
                 if text:
                     texts.append(text)
                     if has_nested:
                         break
         if texts:
             return " ".join(texts)
-        for nested_table in cell_copy.find_all("table"):
-            nested_table.decompose()
-        return cell_copy.get_text(separator=" ", strip=True)
+        return get_text_without_notes(cell, exclude=NESTED_TABLE_TAGS)
 
-    paragraphs = cell_copy.find_all("p", recursive=False)
+    paragraphs = cell.find_all("p", recursive=False)
     if paragraphs:
-        texts = [p.get_text(separator=" ", strip=True) for p in paragraphs if p.get_text(strip=True)]
+        texts = [text for text in (get_text_without_notes(p) for p in paragraphs) if text]
         return " ".join(texts)
 
-    return cell_copy.get_text(separator=" ", strip=True)
+    return get_text_without_notes(cell)
 
 
 def normalize_text(text: str) -> str:
     """Normalize whitespace and trim."""
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # str.split() and ``\s`` agree on what counts as whitespace; splitting avoids the regex engine.
+    return " ".join(text.split())
 
 
 def strip_leading_label(text: str) -> tuple[str, Optional[str]]:
     """Strip leading label from text and return (text_without_label, label)."""
-    m = re.match(r"^(\d+)\.\s+(.*)$", text, re.DOTALL)
+    if not text[:1].isdecimal():
+        return text, None
+    m = LEADING_LABEL_RE.match(text)
     if m:
         return m.group(2).strip(), m.group(1)
     return text, None
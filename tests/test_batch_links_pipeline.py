@@ -14,6 +14,8 @@ def test_slice_entries_offset_and_limit() -> None:
     assert slice_entries(entries, offset=0, limit=2) == entries[:2]
     assert slice_entries(entries, offset=2, limit=2) == entries[2:4]
     assert slice_entries(entries, offset=3, limit=None) == entries[3:]
+    assert slice_entries(entries, offset=0, limit=None) is entries
+    assert slice_entries(entries, offset=0, limit=10) is entries
 
 
 def test_slice_entries_invalid_values_raise() -> None:
@@ -126,3 +126,18 @@ def test_run_coverage_parses_metrics_json_output(monkeypatch, tmp_path: Path) ->
     assert report["phantom_count"] == 2
     assert report["hierarchy_ok"] is False
     assert report["ordering_ok"] is False
+
+
+def test_subprocess_env_is_cached_until_refreshed(monkeypatch) -> None:
+    runner.refresh_subprocess_env()
+    monkeypatch.setenv("EURLEX_BATCH_ENV_PROBE", "first")
+    first = runner._subprocess_env()
+    monkeypatch.setenv("EURLEX_BATCH_ENV_PROBE", "second")
+
+    assert runner._subprocess_env() is first
+    assert first["EURLEX_BATCH_ENV_PROBE"] == "first"
+    assert first["PYTHONPATH"].startswith(str(runner.BASE / "src"))
+
+    runner.refresh_subprocess_env()
+    assert runner._subprocess_env()["EURLEX_BATCH_ENV_PROBE"] == "second"
+    runner.refresh_subprocess_env()
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import re
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from eurlex_unit_parser import EUParser, Unit
+from eurlex_unit_parser.parser.citations import CitationExtractorMixin
 
 
 def _make_unit(id: str, type: str, text: str = "", parent_id: str | None = None, **kwargs) -> Unit:
@@ -893,3 +895,18 @@ def test_internal_subparagraph_of_paragraph() -> None:
     assert citations[0].subparagraph_ordinal == "second"
     assert citations[0].subparagraph_index == 2
     assert citations[0].paragraph == 1
+
+
+def test_keyword_prefilter_covers_every_citation_pattern() -> None:
+    keywords = CitationExtractorMixin._CITATION_KEYWORDS
+    for name, value in vars(CitationExtractorMixin).items():
+        if isinstance(value, re.Pattern) and value is not keywords:
+            assert keywords.search(value.pattern), name
+
+    for pattern, builder_name, required_keywords in CitationExtractorMixin._CITATION_BUILDERS:
+        in_pattern = {match.lastgroup for match in keywords.finditer(pattern.pattern)}
+        assert required_keywords <= in_pattern, builder_name
+
+    units = [_make_unit("u1", "paragraph", text="Member States shall ensure compliance by 1 January 2026.")]
+    _run_enrichment(units)
+    assert units[0].citations == []
@@ -0,0 +1,70 @@
+"""Behavioral tests for the coverage CLI."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from eurlex_unit_parser.cli import coverage as coverage_cli
+
+ARTICLE_HTML = (
+    '<html><body><div class="eli-subdivision" id="art_1">'
+    '<p class="oj-ti-art">Article 1</p>'
+    '<p class="oj-normal">This Regulation lays down rules.</p>'
+    "</div></body></html>"
+)
+ARTICLE_UNIT = {
+    "id": "art-1",
+    "type": "article",
+    "ref": "1",
+    "text": "This Regulation lays down rules.",
+    "parent_id": None,
+    "source_id": "art_1",
+    "source_file": "a_pass.html",
+    "article_number": "1",
+}
+
+
+def _write_pair(root: Path, stem: str, units: list[dict]) -> Path:
+    html_path = root / "downloads" / "eur-lex" / f"{stem}.html"
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    html_path.write_text(ARTICLE_HTML, encoding="utf-8")
+    json_path = root / "out" / "json" / f"{stem}.json"
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    json_path.write_text(json.dumps({"units": units}), encoding="utf-8")
+    return html_path
+
+
+def test_main_with_jobs_replays_output_in_input_order(
+    monkeypatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _write_pair(tmp_path, "a_pass", [ARTICLE_UNIT])
+    _write_pair(tmp_path, "b_fail", [])
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv", ["eurlex-coverage", "--all", "--jobs", "2"])
+
+    with pytest.raises(SystemExit) as exc:
+        coverage_cli.main()
+
+    assert exc.value.code == 1
+    out = capsys.readouterr().out
+    input_order = [p.name for p in (tmp_path / "downloads" / "eur-lex").glob("*.html")]
+    positions = [out.index(f"# {name}\n") for name in input_order]
+    assert positions == sorted(positions)
+    ends = positions[1:] + [len(out)]
+    blocks = {name: out[start:end] for name, start, end in zip(input_order, positions, ends)}
+    assert "- PASS" in blocks["a_pass.html"]
+    assert "- ISSUES" in blocks["b_fail.html"]
+
+
+@pytest.mark.parametrize("jobs", ["0", "-3"])
+def test_main_rejects_non_positive_jobs(monkeypatch, jobs: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["eurlex-coverage", "--all", "--jobs", jobs])
+
+    with pytest.raises(SystemExit) as exc:
+        coverage_cli.main()
+
+    assert exc.value.code == 2
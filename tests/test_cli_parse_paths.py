@@ -15,6 +15,8 @@ from eurlex_unit_parser.models import DocumentMetadata, Unit, ValidationReport
 class _FakeParser:
     def __init__(self, source_file: str):
         self.source_file = source_file
+        self.soup = None
+        self.is_consolidated = False
         self.document_metadata = DocumentMetadata(title="REGULATION (EU) 2024/1", total_units=1)
         self.validation = ValidationReport(
             source_file=source_file,
@@ -72,16 +74,30 @@ def test_main_writes_json_and_default_validation_report(monkeypatch, tmp_path: P
     assert len(payload["units"]) == 1
 
 
+class _FakeParserWithSoup(_FakeParser):
+    parsed_soup = object()
+
+    def __init__(self, source_file: str):
+        super().__init__(source_file)
+        self.soup = self.parsed_soup
+
+
 def test_main_exits_1_when_coverage_flag_reports_failure(monkeypatch, tmp_path: Path) -> None:
     input_html = tmp_path / "sample.html"
     input_html.write_text("<html><body>ok</body></html>", encoding="utf-8")
     out_path = tmp_path / "out.json"
-    monkeypatch.setattr(parse_cli, "EUParser", _FakeParser)
+    monkeypatch.setattr(parse_cli, "EUParser", _FakeParserWithSoup)
     monkeypatch.setattr(parse_cli, "fetch_lsu_summary", lambda **_kwargs: (None, "disabled"))
 
     import eurlex_unit_parser.coverage as coverage_mod
 
-    monkeypatch.setattr(coverage_mod, "coverage_test", lambda *_args, **_kwargs: {"summary": {}})
+    coverage_calls: list[dict] = []
+
+    def fake_coverage_test(*_args, **kwargs):
+        coverage_calls.append(kwargs)
+        return {"summary": {}}
+
+    monkeypatch.setattr(coverage_mod, "coverage_test", fake_coverage_test)
     monkeypatch.setattr(coverage_mod, "validate_hierarchy", lambda *_args, **_kwargs: {"valid": True, "issues": []})
     monkeypatch.setattr(coverage_mod, "print_report", lambda *_args, **_kwargs: False)
     monkeypatch.setattr(
@@ -94,6 +110,11 @@ def test_main_exits_1_when_coverage_flag_reports_failure(monkeypatch, tmp_path:
         parse_cli.main()
 
     assert exc.value.code == 1
+    # The parser's own tree, units and format are reused instead of re-reading the input.
+    assert len(coverage_calls) == 1
+    assert coverage_calls[0]["soup"] is _FakeParserWithSoup.parsed_soup
+    assert coverage_calls[0]["is_consolidated"] is False
+    assert [unit["id"] for unit in coverage_calls[0]["units"]] == ["art-1"]
 
 
 def test_main_no_summary_lsu_sets_disabled_without_fetch(monkeypatch, tmp_path: Path) -> None:
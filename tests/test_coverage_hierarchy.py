@@ -0,0 +1,92 @@
+"""Tests for hierarchy validation of parsed units."""
+
+from __future__ import annotations
+
+from eurlex_unit_parser.coverage import validate_hierarchy, validate_ordering
+from eurlex_unit_parser.coverage.hierarchy import MAX_HIERARCHY_ISSUES
+from eurlex_unit_parser.models import Unit
+
+
+def _unit(unit_id: str, unit_type: str, parent_id: str | None = None, **fields: str) -> dict:
+    return {"id": unit_id, "type": unit_type, "parent_id": parent_id, **fields}
+
+
+def test_validate_hierarchy_checks_label_suffix_at_end_of_id() -> None:
+    units = [
+        _unit("art-5", "article"),
+        _unit("art-5.par-10", "paragraph", "art-5", paragraph_number="1"),
+        _unit("art-5.par-1", "paragraph", "art-5", paragraph_number="1"),
+        _unit("art-5.par-1_1", "paragraph", "art-5", paragraph_number="1"),
+        _unit("art-5.par-1.pt-a", "point", "art-5.par-1", point_label="a"),
+        _unit("art-5.par-1.pt-ab", "point", "art-5.par-1", point_label="a"),
+    ]
+
+    result = validate_hierarchy(units)
+
+    assert result["valid"] is False
+    assert [(issue["type"], issue["id"]) for issue in result["issues"]] == [
+        ("id_mismatch", "art-5.par-10"),
+        ("id_mismatch", "art-5.par-1.pt-ab"),
+    ]
+
+
+def test_validate_hierarchy_reports_orphans_and_wrong_parent_types() -> None:
+    units = [
+        _unit("art-1", "article"),
+        _unit("art-1.sub-i", "subpoint", "art-1"),
+        _unit("art-1.par-2.pt-a", "point", "art-1.par-2", point_label="a"),
+    ]
+
+    issues = validate_hierarchy(units)["issues"]
+
+    assert issues == [
+        {
+            "type": "wrong_parent_type",
+            "id": "art-1.sub-i",
+            "message": "subpoint has parent type 'article', expected one of ['point', 'annex_item']",
+        },
+        {
+            "type": "orphan",
+            "id": "art-1.par-2.pt-a",
+            "message": "parent_id 'art-1.par-2' does not exist",
+        },
+    ]
+
+
+def test_validate_ordering_accepts_subparagraphs_between_point_runs() -> None:
+    units = [
+        _unit("art-1.par-1", "paragraph"),
+        _unit("art-1.par-1.pt-a", "point", "art-1.par-1"),
+        _unit("art-1.par-1.subpar-2", "subparagraph", "art-1.par-1"),
+        _unit("art-1.par-1.pt-b", "point", "art-1.par-1"),
+    ]
+
+    assert validate_ordering(units) == {"valid": True, "issues": []}
+
+
+def test_validate_hierarchy_caps_issue_list_and_counts_the_rest() -> None:
+    units = [
+        _unit(f"art-1.par-{i}", "paragraph", "missing-parent")
+        for i in range(MAX_HIERARCHY_ISSUES + 7)
+    ]
+
+    result = validate_hierarchy(units)
+
+    assert result["valid"] is False
+    assert len(result["issues"]) == MAX_HIERARCHY_ISSUES
+    assert result["truncated"] == 7
+
+
+def test_validate_hierarchy_accepts_unit_objects() -> None:
+    units = [
+        _unit("art-5", "article"),
+        _unit("art-5.par-10", "paragraph", "art-5", paragraph_number="1"),
+        _unit("art-5.par-1.pt-a", "point", "art-5.par-1", point_label="a"),
+        _unit("art-5.par-1.pt-a.sub-i", "subpoint", "art-5", subpoint_label="i"),
+    ]
+    unit_objects = [
+        Unit(ref=None, source_id="", source_file="inline.html", text="", **unit) for unit in units
+    ]
+
+    assert validate_hierarchy(unit_objects) == validate_hierarchy(units)
+    assert validate_hierarchy(unit_objects)["issues"] != []
@@ -0,0 +1,77 @@
+"""Tests for the coverage report printer."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from eurlex_unit_parser.coverage import print_report
+from eurlex_unit_parser.coverage.report import _build_report_lines
+
+
+def _report(missing: list[str]) -> dict:
+    return {
+        "format": "oj",
+        "oracle": "naive",
+        "paragraphs": {"1": {"html_count": 2, "json_count": 2 - len(missing), "missing": missing}},
+        "points": {},
+        "summary": {
+            "coverage_pct": 50.0 if missing else 100.0,
+            "total_html_segments": 2,
+            "total_missing": len(missing),
+            "gone": len(missing),
+        },
+    }
+
+
+def test_print_report_writes_built_lines_with_metrics_last(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    report = _report(["missing paragraph text"])
+    hierarchy = {"valid": True, "issues": []}
+
+    passed = print_report(report, hierarchy, verbose=True)
+
+    lines, built_passed = _build_report_lines(report, hierarchy, verbose=True)
+    assert passed is built_passed is False
+    assert capsys.readouterr().out == "\n".join(lines) + "\n"
+    assert "       - missing paragraph text" in lines
+    assert "ISSUES" in next(line for line in lines if line.startswith("SUMMARY:"))
+    assert lines[-1].startswith("METRICS_JSON: ")
+
+
+def test_print_report_passes_clean_report(capsys: pytest.CaptureFixture[str]) -> None:
+    assert print_report(_report([]), {"valid": True, "issues": []}) is True
+    assert "- PASS" in capsys.readouterr().out
+
+
+def test_metrics_json_line_round_trips_for_batch_runner() -> None:
+    lines, passed = _build_report_lines(_report([]), {"valid": True, "issues": []})
+
+    assert passed is True
+    payload = lines[-1][len("METRICS_JSON:") :].strip()
+
+    assert payload == json.dumps(json.loads(payload))
+    assert json.loads(payload)["hierarchy_ok"] is True
+
+
+@pytest.mark.parametrize(
+    ("hierarchy", "phantom", "ordering"),
+    [
+        ({"valid": False, "issues": [{"type": "orphan", "id": "x", "message": "m"}]}, None, None),
+        ({"valid": True, "issues": []}, {"total": 1}, None),
+        (
+            {"valid": True, "issues": []},
+            None,
+            {"valid": False, "issues": [{"type": "interleaved", "parent_id": "p", "message": "m"}]},
+        ),
+    ],
+)
+def test_report_fails_and_metrics_agree_for_each_check(hierarchy, phantom, ordering) -> None:
+    lines, passed = _build_report_lines(_report([]), hierarchy, phantom=phantom, ordering=ordering)
+
+    metrics = json.loads(lines[-1][len("METRICS_JSON:") :])
+    assert passed is False
+    assert "ISSUES" in next(line for line in lines if line.startswith("SUMMARY:"))
+    assert not (metrics["hierarchy_ok"] and metrics["ordering_ok"] and metrics["phantom"] == 0)
@@ -8,15 +8,19 @@ from pathlib import Path
 from types import ModuleType
 
 import pytest
+import requests
 
 from eurlex_unit_parser.download import eurlex
 
+_try_http_fetch = eurlex._try_http_fetch
+
 
 class _FakePage:
     def __init__(self, content: str, raise_on_goto: bool = False):
         self._content = content
         self._raise_on_goto = raise_on_goto
         self.goto_url: str | None = None
+        self.closed = False
 
     def goto(self, url: str, wait_until: str, timeout: int) -> None:
         _ = wait_until, timeout
@@ -30,23 +34,30 @@ class _FakePage:
     def content(self) -> str:
         return self._content
 
+    def close(self) -> None:
+        self.closed = True
+
 
 class _FakeContext:
-    def __init__(self, page: _FakePage):
+    def __init__(self, page: _FakePage, raise_on_new_page: bool = False):
         self._page = page
+        self.raise_on_new_page = raise_on_new_page
 
     def new_page(self) -> _FakePage:
+        if self.raise_on_new_page:
+            raise RuntimeError("new_page failed")
         return self._page
 
 
 class _FakeBrowser:
-    def __init__(self, page: _FakePage):
+    def __init__(self, page: _FakePage, raise_on_new_page: bool = False):
         self._page = page
+        self._raise_on_new_page = raise_on_new_page
         self.closed = False
 
     def new_context(self, user_agent: str) -> _FakeContext:
         _ = user_agent
-        return _FakeContext(self._page)
+        return _FakeContext(self._page, self._raise_on_new_page)
 
     def close(self) -> None:
         self.closed = True
@@ -55,30 +66,45 @@ class _FakeBrowser:
 class _FakeChromium:
     def __init__(self, page: _FakePage):
         self._page = page
+        self.launches = 0
+        self.raise_on_launch = False
+        self.raise_on_new_page = False
 
     def launch(self, headless: bool) -> _FakeBrowser:
         _ = headless
-        return _FakeBrowser(self._page)
+        self.launches += 1
+        if self.raise_on_launch:
+            raise RuntimeError("launch failed")
+        return _FakeBrowser(self._page, self.raise_on_new_page)
 
 
 class _FakePlaywrightCtx:
     def __init__(self, page: _FakePage):
         self.chromium = _FakeChromium(page)
+        self.exits = 0
 
     def __enter__(self) -> "_FakePlaywrightCtx":
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
         _ = exc_type, exc_val, exc_tb
+        self.exits += 1
         return False
 
 
-def _install_fake_playwright(monkeypatch, page: _FakePage) -> None:
+def _install_fake_playwright(monkeypatch, page: _FakePage) -> _FakePlaywrightCtx:
+    playwright = _FakePlaywrightCtx(page)
     sync_api = ModuleType("playwright.sync_api")
-    sync_api.sync_playwright = lambda: _FakePlaywrightCtx(page)
+    sync_api.sync_playwright = lambda: playwright
     pkg = ModuleType("playwright")
     monkeypatch.setitem(sys.modules, "playwright", pkg)
     monkeypatch.setitem(sys.modules, "playwright.sync_api", sync_api)
+    return playwright
+
+
+@pytest.fixture(autouse=True)
+def _no_http_fast_path(monkeypatch) -> None:
+    monkeypatch.setattr(eurlex, "_try_http_fetch", lambda *_args, **_kwargs: None)
 
 
 def test_extract_name_from_url_uses_uri_param() -> None:
@@ -104,7 +130,7 @@ def test_download_eurlex_returns_false_when_playwright_missing(monkeypatch, tmp_
 
 
 def test_download_eurlex_writes_file_and_applies_language(monkeypatch, tmp_path: Path) -> None:
-    content = "<html><body><div class='eli-container'>" + ("x" * 1500) + "</div></body></html>"
+    content = "<html><body><div class='eli-container'>" + ("x" * 1500) + "—</div></body></html>"
     page = _FakePage(content=content)
     _install_fake_playwright(monkeypatch, page)
     out_path = tmp_path / "d" / "doc.html"
@@ -117,12 +143,13 @@ def test_download_eurlex_writes_file_and_applies_language(monkeypatch, tmp_path:
 
     assert result.ok is True
     assert result.status == "ok"
-    assert result.bytes_written == len(content)
+    assert result.bytes_written == len(content.encode("utf-8")) == out_path.stat().st_size
     assert result.final_url is not None
     assert "/PL/TXT/" in result.final_url
     assert out_path.exists()
     assert page.goto_url is not None
     assert "/PL/TXT/" in page.goto_url
+    assert page.closed is True
 
 
 def test_download_eurlex_returns_false_for_short_content(monkeypatch, tmp_path: Path) -> None:
@@ -148,20 +175,168 @@ def test_download_eurlex_returns_false_on_runtime_error(monkeypatch, tmp_path: P
     assert result.status == "navigation_error"
 
 
-def test_main_returns_exit_code_based_on_download_result(monkeypatch, tmp_path: Path) -> None:
+def test_downloader_reuses_one_browser_for_many_urls(monkeypatch, tmp_path: Path) -> None:
+    content = "<html><body><div class='eli-container'>" + ("x" * 1500) + "</div></body></html>"
+    playwright = _install_fake_playwright(monkeypatch, _FakePage(content=content))
+
+    with eurlex.EurLexDownloader() as downloader:
+        results = [
+            downloader.download(
+                f"https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:3202{i}R0001",
+                tmp_path / f"doc{i}.html",
+            )
+            for i in range(3)
+        ]
+
+    assert [r.ok for r in results] == [True, True, True]
+    assert playwright.chromium.launches == 1
+
+
+def test_downloader_keeps_http_session_when_browser_launch_fails(monkeypatch, tmp_path: Path) -> None:
+    closed_sessions: list[requests.Session] = []
+
+    class _CountingSession(requests.Session):
+        def close(self) -> None:
+            closed_sessions.append(self)
+            super().close()
+
+    monkeypatch.setattr(eurlex.requests, "Session", _CountingSession)
+    http_sessions: list[requests.Session | None] = []
     monkeypatch.setattr(
-        eurlex,
-        "download_eurlex",
-        lambda *_args, **_kwargs: eurlex.DownloadResult(
-            ok=True,
-            status="ok",
-            error=None,
-            output_path=tmp_path / "dummy.html",
-            final_url="https://eur-lex.europa.eu",
-            bytes_written=1,
-            method="playwright",
-        ),
+        eurlex, "_try_http_fetch", lambda _url, session=None: http_sessions.append(session)
+    )
+    playwright = _install_fake_playwright(monkeypatch, _FakePage(content="unused"))
+    playwright.chromium.raise_on_launch = True
+
+    with eurlex.EurLexDownloader() as downloader:
+        session = downloader._session
+        for i in range(2):
+            with pytest.raises(RuntimeError):
+                downloader.download(
+                    f"https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:3202{i}R0001",
+                    tmp_path / f"doc{i}.html",
+                )
+            assert downloader._session is session
+
+    assert session is not None
+    assert http_sessions == [session, session]
+    assert closed_sessions == [session]
+    assert playwright.chromium.launches == 2
+    assert playwright.exits == 2
+
+
+def test_download_returns_navigation_error_when_page_creation_fails(monkeypatch, tmp_path: Path) -> None:
+    page = _FakePage(content="unused")
+    playwright = _install_fake_playwright(monkeypatch, page)
+    playwright.chromium.raise_on_new_page = True
+
+    result = eurlex.download_eurlex(
+        "https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32024R1689",
+        tmp_path / "err.html",
+    )
+
+    assert result.ok is False
+    assert result.status == "navigation_error"
+    assert result.error == "new_page failed"
+    assert page.closed is False
+
+
+def test_downloader_skips_browser_when_http_returns_eli_document(monkeypatch, tmp_path: Path) -> None:
+    content = "<html><body><div class='eli-container'>" + ("x" * 1500) + "</div></body></html>"
+    playwright = _install_fake_playwright(monkeypatch, _FakePage(content="unused"))
+    monkeypatch.setattr(eurlex, "_try_http_fetch", lambda *_args, **_kwargs: content)
+
+    result = eurlex.download_eurlex(
+        "https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32024R1689",
+        tmp_path / "doc.html",
     )
+
+    assert result.ok is True
+    assert result.method == "requests"
+    assert (tmp_path / "doc.html").read_text(encoding="utf-8") == content
+    assert playwright.chromium.launches == 0
+
+
+class _FakeSession:
+    def __init__(self, response: requests.Response):
+        self._response = response
+
+    def get(self, *_args, **_kwargs) -> requests.Response:
+        return self._response
+
+
+def _http_response(
+    body: str, status_code: int = 200, content_type: str = "text/html; charset=utf-8"
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = content_type
+    response._content = body.encode("utf-8")
+    # Mirrors how requests' HTTPAdapter picks the encoding when it builds a response.
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def test_try_http_fetch_rejects_pages_without_eli_structure() -> None:
+    eli_page = "<div class='eli-subdivision'>" + ("x" * 1500) + "</div>"
+    url = "https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32024R1689"
+    assert _try_http_fetch(url, _FakeSession(_http_response(eli_page))) == eli_page
+    assert _try_http_fetch(url, _FakeSession(_http_response("<div>" + ("x" * 1500) + "</div>"))) is None
+    assert _try_http_fetch(url, _FakeSession(_http_response(eli_page, status_code=202))) is None
+
+
+def test_try_http_fetch_decodes_html_without_charset_as_utf8(tmp_path: Path) -> None:
+    eli_page = "<div class='eli-subdivision'>Článek 1 – é—" + ("x" * 1500) + "</div>"
+    url = "https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32024R1689"
+    response = _http_response(eli_page, content_type="text/html")
+    assert response.encoding == "ISO-8859-1"
+
+    content = _try_http_fetch(url, _FakeSession(response))
+
+    assert content == eli_page
+    out_path = tmp_path / "doc.html"
+    assert eurlex._write_content(content, out_path, url, "requests").ok is True
+    assert out_path.read_bytes() == eli_page.encode("utf-8")
+
+
+def test_try_http_fetch_keeps_declared_charset() -> None:
+    eli_page = "<div class='eli-subdivision'>Gesetz über é" + ("x" * 1500) + "</div>"
+    url = "https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=CELEX:32024R1689"
+    response = _http_response("", content_type="text/html; charset=ISO-8859-1")
+    response._content = eli_page.encode("latin-1")
+
+    assert _try_http_fetch(url, _FakeSession(response)) == eli_page
+
+
+def test_parse_targets_pairs_urls_with_optional_names() -> None:
+    assert eurlex._parse_targets(["https://a/?uri=X", "EMIR3", "https://b/?uri=Y"]) == [
+        ("https://a/?uri=X", "EMIR3"),
+        ("https://b/?uri=Y", None),
+    ]
+    with pytest.raises(ValueError):
+        eurlex._parse_targets(["EMIR3"])
+
+
+def test_main_returns_exit_code_based_on_download_result(monkeypatch, tmp_path: Path) -> None:
+    class _FakeDownloader:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc) -> None:
+            return None
+
+        def download(self, *_args, **_kwargs) -> eurlex.DownloadResult:
+            return eurlex.DownloadResult(
+                ok=True,
+                status="ok",
+                error=None,
+                output_path=tmp_path / "dummy.html",
+                final_url="https://eur-lex.europa.eu",
+                bytes_written=1,
+                method="playwright",
+            )
+
+    monkeypatch.setattr(eurlex, "EurLexDownloader", _FakeDownloader)
     monkeypatch.setattr(
         sys,
         "argv",
@@ -2,20 +2,51 @@
 
 from __future__ import annotations
 
+import json
+import os
+from pathlib import Path
+
+import pytest
 from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
 
+from eurlex_unit_parser.coverage import coverage_test
 from eurlex_unit_parser.coverage.extract_html import (
+    NON_TEXT_TAGS,
     build_naive_section_map,
+    build_naive_section_map_lxml,
     detect_format,
+    detect_format_html,
+    detect_format_lxml,
+    extract_naive_segments,
     looks_like_label,
+    normalize_whitespace,
+    parse_coverage_html,
+    parse_coverage_lxml,
     strip_leading_ref,
 )
+from eurlex_unit_parser.text_utils import (
+    get_cell_text,
+    get_text_without_notes,
+    normalize_text,
+    read_html_bytes,
+    read_html_file,
+    remove_note_tags,
+    strip_leading_label,
+)
 
 
 def test_strip_leading_ref_removes_nested_prefixes() -> None:
     assert strip_leading_ref("1. (a) — Actual legal text") == "Actual legal text"
 
 
+def test_whitespace_normalizers_collapse_unicode_whitespace() -> None:
+    raw = "\u00a0 1.\tFirst\r\n\u2003 line\x1c "
+    assert normalize_text(raw) == normalize_whitespace(raw) == "1. First line"
+    assert strip_leading_label("1.\u00a0Text with label ") == ("Text with label", "1")
+    assert strip_leading_label("(a) Text without numeric label") == ("(a) Text without numeric label", None)
+
+
 def test_looks_like_label_detects_article_heading() -> None:
     assert looks_like_label("Article 8") is True
     assert looks_like_label("Substantive requirement text") is False
@@ -44,3 +75,212 @@ def test_build_naive_section_map_skips_correlation_table_annex() -> None:
 def test_detect_format_true_when_grid_container_present() -> None:
     soup = BeautifulSoup("<html><body><div class='grid-container'></div></body></html>", "lxml")
     assert detect_format(soup) is True
+
+
+GRID_OUTSIDE_SECTIONS_HTML = """
+<html><body>
+  <div class="grid-container"><p>Consolidated layout wrapper.</p></div>
+  <div class="eli-subdivision" id="art_1">
+    <p class="oj-ti-art">Article 1</p>
+    <p class="oj-normal">Article body text kept for coverage.</p>
+  </div>
+</body></html>
+"""
+
+
+def test_detect_format_html_sees_markers_outside_coverage_sections() -> None:
+    html = GRID_OUTSIDE_SECTIONS_HTML
+    assert detect_format(parse_coverage_html(html)) is False
+    assert detect_format_html(html) is detect_format(BeautifulSoup(html, "lxml")) is True
+    assert detect_format_html(html.encode("utf-8")) is True
+    assert detect_format_lxml(parse_coverage_lxml(html)) is True
+    assert detect_format_html("<p>grid-container is only mentioned in text.</p>") is False
+    assert detect_format_html("<p class='oj-normal'>Plain OJ text.</p>") is False
+
+
+@pytest.mark.parametrize("oracle", ["naive", "mirror"])
+def test_coverage_test_reports_format_of_whole_document(tmp_path: Path, oracle: str) -> None:
+    html_path = tmp_path / "doc.html"
+    html_path.write_text(GRID_OUTSIDE_SECTIONS_HTML, encoding="utf-8")
+    json_path = tmp_path / "doc.json"
+    json_path.write_text(json.dumps({"units": []}), encoding="utf-8")
+
+    report = coverage_test(html_path, json_path, oracle=oracle)
+    assert report["format"] == "Consolidated"
+
+    soup = BeautifulSoup(GRID_OUTSIDE_SECTIONS_HTML, "lxml")
+    report = coverage_test(html_path, json_path, oracle=oracle, soup=soup)
+    assert report["format"] == "Consolidated"
+
+    html = html_path.read_bytes()
+    report = coverage_test(
+        html_path,
+        json_path,
+        oracle=oracle,
+        soup=parse_coverage_html(html),
+        is_consolidated=detect_format_html(html),
+    )
+    assert report["format"] == "Consolidated"
+
+
+@pytest.mark.parametrize("oracle", ["naive", "mirror"])
+def test_coverage_test_with_supplied_soup_and_units_opens_no_files(
+    monkeypatch, tmp_path: Path, oracle: str
+) -> None:
+    import eurlex_unit_parser.coverage.core as core_mod
+
+    def fail_read(path: object) -> bytes:
+        raise AssertionError(f"coverage_test re-read {path}")
+
+    monkeypatch.setattr(core_mod, "read_html_bytes", fail_read)
+    soup = BeautifulSoup(GRID_OUTSIDE_SECTIONS_HTML, "lxml")
+
+    report = coverage_test(
+        tmp_path / "missing.html", tmp_path / "missing.json", oracle=oracle, soup=soup, units=[]
+    )
+
+    assert report["format"] == "Consolidated"
+
+
+def test_extract_naive_segments_skips_headings_without_mutating_source() -> None:
+    html = """
+    <div class="eli-subdivision" id="art_3">
+      <p class="oj-ti-art">Article 3</p>
+      <div class="eli-title"><p class="oj-sti-art">Heading text that is long</p></div>
+      <p class="oj-normal">1. First paragraph text of the article.</p>
+      <p class="oj-normal"><span>Split</span> <span>second paragraph text</span></p>
+    </div>
+    """
+    soup = BeautifulSoup(html, "lxml")
+    container = soup.find("div", id="art_3")
+    before = str(container)
+
+    assert extract_naive_segments(container) == [
+        "First paragraph text of the article.",
+        "second paragraph text",
+    ]
+    assert str(container) == before
+
+
+def test_get_text_without_notes_matches_remove_note_tags_on_copy() -> None:
+    html = (
+        '<table><tr><td><p class="oj-normal">(a)</p></td><td><p class="oj-normal">Cell text'
+        '<a class="oj-note-tag" href="#ntr1-L_2022333EN.01000101-E0001">(<span class="oj-super">1</span>)</a>'
+        ' continues <span class="oj-super">*2</span><span class="oj-super">bis</span></p></td></tr></table>'
+    )
+    soup = BeautifulSoup(html, "lxml")
+    cell = soup.find_all("td")[1]
+    before = str(soup)
+
+    expected_copy = BeautifulSoup(str(cell), "lxml").find("td")
+    remove_note_tags(expected_copy)
+    expected = expected_copy.get_text(separator=" ", strip=True)
+
+    assert get_text_without_notes(cell) == expected == "Cell text continues bis"
+    assert get_cell_text(cell) == expected
+    assert str(soup) == before
+
+
+def test_get_text_without_notes_skips_excluded_tags() -> None:
+    html = (
+        "<table><tr><td>Bare <span class='oj-note-tag'>(1)</span>text<p>Paragraph</p>"
+        "<figure>Figure</figure><table><tr><td>Nested</td></tr></table> tail</td></tr></table>"
+    )
+    soup = BeautifulSoup(html, "lxml")
+    cell = soup.find("td")
+
+    text = get_text_without_notes(cell, exclude=frozenset({"p", "figure", "table"}))
+
+    assert text == "Bare text tail"
+
+
+def test_parse_coverage_html_keeps_only_section_containers() -> None:
+    html = """
+    <html><head><title>Page chrome</title></head><body>
+      <div class="nav"><a href="/home">Navigation link text</a></div>
+      <div class="eli-container">
+        <div class="eli-subdivision" id="art_1">
+          <p class="title-article-norm">Article 1</p>
+          <p class="norm">Article body text kept for coverage.</p>
+        </div>
+        <div class="eli-container" id=" anx_I ">
+          <p>Annex body text kept for coverage.</p>
+        </div>
+      </div>
+    </body></html>
+    """
+    soup = parse_coverage_html(html)
+
+    assert soup.find("title") is None
+    assert soup.find("div", class_="nav") is None
+    assert detect_format(soup) is True
+    assert build_naive_section_map(soup) == {
+        "art_1": ["Article body text kept for coverage."],
+        "annex_I": ["Annex body text kept for coverage."],
+    }
+
+
+def test_non_text_tags_match_bs4_string_containers() -> None:
+    # The lxml path copies bs4's special string containers; a bs4 release that changes them fails here.
+    assert frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS) == NON_TEXT_TAGS
+
+
+def test_naive_section_map_lxml_matches_bs4_path() -> None:
+    html = """
+    <html><head><script>var skipped = "script text outside sections";</script></head><body>
+      <div class="eli-subdivision" id="rct_1">
+        <table><tr><td><p class="oj-normal">(1)</p></td>
+        <td><p class="oj-normal">Recital text long enough to count.<!-- comment text --> Tail text
+        after the comment.</p></td></tr></table>
+      </div>
+      <div class="eli-subdivision" id="art_2">
+        <p class="oj-ti-art">Article 2</p>
+        <p class="oj-normal">1. Paragraph with <span class="oj-super">3</span> a note marker
+        <style>.hidden { display: none }</style>and a style block.</p>
+        <p class="oj-normal">Ruby <ruby>base<rp>(</rp><rt>annotation text here</rt><rp>)</rp></ruby> text.</p>
+      </div>
+      <div class="eli-container" id="anx_I">
+        <p class="oj-doc-ti">ANNEX I</p>
+        <p class="oj-ti-tbl">Correlation table</p>
+        <p>Skipped correlation table row text.</p>
+      </div>
+      <div class="eli-container" id=" anx_II ">
+        <p class="oj-doc-ti">ANNEX II</p>
+        <template><p>Template text is not rendered.</p></template>
+        <p>Annex body text kept for coverage.</p>
+      </div>
+    </body></html>
+    """
+    soup = parse_coverage_html(html.encode("utf-8"))
+    root = parse_coverage_lxml(html.encode("utf-8"))
+
+    assert detect_format_lxml(root) is detect_format(soup) is False
+    sections = build_naive_section_map_lxml(root)
+    assert sections == build_naive_section_map(soup)
+    assert "annex_I" not in sections
+    assert sections["annex_II"] == ["Annex body text kept for coverage."]
+
+
+def test_read_html_helpers_match_pathlib_reads(tmp_path: Path) -> None:
+    html_path = tmp_path / "doc.html"
+    html_path.write_bytes("<p>Článek 1 – Żółć</p>\r\n<p>Δεύτερο</p>\r\n".encode())
+
+    assert read_html_file(html_path) == html_path.read_text(encoding="utf-8")
+    assert read_html_bytes(str(html_path)) == html_path.read_bytes()
+
+
+def test_read_html_helpers_ignore_fadvise_errors(monkeypatch, tmp_path: Path) -> None:
+    html_path = tmp_path / "doc.html"
+    html_path.write_bytes("<p>Článek 1</p>\r\n".encode())
+    calls: list[int] = []
+
+    def failing_fadvise(fd: int, offset: int, length: int, advice: int) -> None:
+        calls.append(fd)
+        raise OSError("fadvise not supported")
+
+    monkeypatch.setattr(os, "posix_fadvise", failing_fadvise, raising=False)
+    monkeypatch.setattr(os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+
+    assert read_html_file(html_path) == html_path.read_text(encoding="utf-8")
+    assert read_html_bytes(html_path) == html_path.read_bytes()
+    assert len(calls) == 2
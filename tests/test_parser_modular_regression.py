@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
+
 from eurlex_unit_parser import EUParser
 
 
 def _parse(html: str):
-    return [u.__dict__ for u in EUParser("inline.html").parse(html)]
+    return [asdict(u) for u in EUParser("inline.html").parse(html)]
 
 
 def test_oj_paragraph_and_point_structure() -> None: